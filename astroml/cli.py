@@ -2,12 +2,24 @@ from __future__ import annotations
 
 import argparse
 import json
-from typing import Optional
+from typing import Any, Optional
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # Fallback to stdlib json
 
 from .ingestion.service import IngestionService
 from .ingestion.state import StateStore
 
 
+def _dumps_pretty(obj: Any) -> str:
+    """Serialize `obj` as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
 def main(argv: Optional[list[str]] = None) -> int:
     parser = argparse.ArgumentParser(prog="astroml", description="AstroML utilities CLI")
     sub = parser.add_subparsers(dest="command", required=True)
@@ -21,6 +33,18 @@ def main(argv: Optional[list[str]] = None) -> int:
         default=None,
         help="Path to state file (defaults to ./.astroml_state/ingestion_state.json)",
     )
+    ingest.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Threads fetching ledgers concurrently (default: 1, sequential)",
+    )
+    ingest.add_argument(
+        "--batch-size",
+        type=int,
+        default=32,
+        help="Maximum ledgers fetched ahead of processing when --workers > 1",
+    )
 
     args = parser.parse_args(argv)
 
@@ -43,12 +67,14 @@ def main(argv: Optional[list[str]] = None) -> int:
             end_ledger=args.end,
             fetch_fn=fetch_fn,
             process_fn=process_fn,
+            workers=args.workers,
+            batch_size=args.batch_size,
         )
-        print(json.dumps({
+        print(_dumps_pretty({
             "attempted": result.attempted,
             "processed": result.processed,
             "skipped": result.skipped,
-        }, indent=2))
+        }))
         return 0
 
     parser.print_help()
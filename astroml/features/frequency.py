@@ -70,6 +70,17 @@ def _validate_dataframe(
         )
 
 
+def _day_numbers(timestamps: pd.Series) -> np.ndarray:
+    """Integer day numbers (day resolution) straight from the datetime64 buffer.
+
+    Timezone-aware timestamps are bucketed by their local calendar day.
+    """
+    if isinstance(timestamps.dtype, pd.DatetimeTZDtype):
+        timestamps = timestamps.dt.tz_localize(None)
+    ns = timestamps.to_numpy(dtype='datetime64[ns]').view('i8')
+    return ns // 86_400_000_000_000
+
+
 def _extract_daily_counts(
     timestamps: pd.Series,
 ) -> np.ndarray:
@@ -105,28 +116,18 @@ def _extract_daily_counts(
     if len(timestamps) == 0:
         return np.array([])
 
-    # Convert timestamps to dates (day resolution)
-    dates = timestamps.dt.date
-
     # Handle single timestamp
     if len(timestamps) == 1:
         return np.array([1])
 
-    # Determine first and last transaction dates
-    min_date = dates.min()
-    max_date = dates.max()
-
-    # Create complete date range from first to last
-    date_range = pd.date_range(start=min_date, end=max_date, freq='D')
+    days = _day_numbers(timestamps)
 
-    # Count transactions per day using value_counts
-    daily_counts = dates.value_counts()
+    # First/last transaction day as int64 reductions (no Python date objects)
+    lo, hi = days.min(), days.max()
 
-    # Fill missing days with 0
-    daily_counts = daily_counts.reindex(date_range.date, fill_value=0)
-
-    # Return as numpy array
-    return daily_counts.values
+    # Count transactions per day offset from the first day; bincount fills
+    # days without transactions with 0
+    return np.bincount(days - lo, minlength=int(hi - lo + 1))
 
 
 
@@ -165,6 +166,108 @@ def _compute_burstiness(mean: float, std: float) -> float:
     # Handle edge case: when mean + std == 0, return 0.0
     if mean + std == 0.0:
         return 0.0
-    
+
     # Calculate burstiness: (std - mean) / (std + mean)
     return (std - mean) / (std + mean)
+
+
+def _compute_burstiness_vec(mean: np.ndarray, std: np.ndarray) -> np.ndarray:
+    """Vectorized burstiness for arrays of per-account means and stds.
+
+    Computes B = (σ - μ) / (σ + μ) elementwise without a Python branch; entries
+    where σ + μ = 0 are 0.0, matching :func:`_compute_burstiness`.
+
+    Args:
+        mean: Array of mean daily counts (μ ≥ 0).
+        std: Array of daily-count standard deviations (σ ≥ 0), same shape.
+
+    Returns:
+        Array of burstiness values in [-1, 1].
+
+    Examples:
+        >>> _compute_burstiness_vec(np.array([5.0, 0.0]), np.array([0.0, 0.0]))
+        array([-1.,  0.])
+    """
+    denom = std + mean
+    return np.divide(std - mean, denom, out=np.zeros_like(denom), where=denom > 0)
+
+
+def compute_frequency_metrics(
+    df: pd.DataFrame,
+    timestamp_col: str = 'timestamp',
+    account_col: str = 'account',
+) -> pd.DataFrame:
+    """Compute per-account transaction frequency metrics.
+
+    Daily counts for every account are built in a single vectorized pass: each
+    account's active window (first to last transaction day, inclusive) is laid
+    out back to back in one flat array, CSR-style, and filled with one
+    ``np.bincount`` call. Mean and standard deviation are then per-segment
+    reductions over that array, so no Python loop runs over accounts.
+
+    Args:
+        df: DataFrame with one row per transaction.
+        timestamp_col: Column with datetimes or numeric Unix timestamps (seconds).
+        account_col: Column with account identifiers.
+
+    Returns:
+        DataFrame indexed by account (in order of first appearance) with
+        columns ``mean_tx_per_day``, ``std_tx_per_day`` and ``burstiness``.
+
+    Raises:
+        ValueError: If the input fails :func:`_validate_dataframe`.
+
+    Notes:
+        - The standard deviation is the population std (ddof=0) of the
+          account's daily counts, matching ``np.std``.
+        - Equivalent to calling :func:`_extract_daily_counts` per account.
+
+    Examples:
+        >>> import pandas as pd
+        >>> df = pd.DataFrame({
+        ...     'account': ['a', 'a', 'a', 'b'],
+        ...     'timestamp': pd.to_datetime([
+        ...         '2024-01-01', '2024-01-01', '2024-01-03', '2024-01-02'
+        ...     ]),
+        ... })
+        >>> compute_frequency_metrics(df)['mean_tx_per_day'].tolist()
+        [1.0, 1.0]
+    """
+    _validate_dataframe(df, timestamp_col, account_col)
+    columns = ['mean_tx_per_day', 'std_tx_per_day', 'burstiness']
+
+    if len(df) == 0:
+        return pd.DataFrame(columns=columns, dtype=float).rename_axis(account_col)
+
+    timestamps = df[timestamp_col]
+    if pd.api.types.is_numeric_dtype(timestamps):
+        timestamps = pd.to_datetime(timestamps, unit='s')
+
+    days = _day_numbers(timestamps)
+    codes, accounts = pd.factorize(df[account_col])
+    n_accounts = len(accounts)
+
+    # Active window per account
+    first_day = np.full(n_accounts, np.iinfo(np.int64).max, dtype=np.int64)
+    last_day = np.full(n_accounts, np.iinfo(np.int64).min, dtype=np.int64)
+    np.minimum.at(first_day, codes, days)
+    np.maximum.at(last_day, codes, days)
+    n_days = last_day - first_day + 1
+
+    # Flat (account, day) layout: account a owns [starts[a], starts[a] + n_days[a])
+    starts = np.concatenate(([0], np.cumsum(n_days)[:-1]))
+    flat_idx = starts[codes] + (days - first_day[codes])
+    counts = np.bincount(flat_idx, minlength=int(n_days.sum())).astype(float)
+
+    segment = np.repeat(np.arange(n_accounts), n_days)
+    total = np.bincount(segment, weights=counts, minlength=n_accounts)
+    total_sq = np.bincount(segment, weights=counts * counts, minlength=n_accounts)
+    mean = total / n_days
+    std = np.sqrt(np.clip(total_sq / n_days - mean * mean, 0.0, None))
+
+    burstiness = _compute_burstiness_vec(mean, std)
+
+    return pd.DataFrame(
+        {'mean_tx_per_day': mean, 'std_tx_per_day': std, 'burstiness': burstiness},
+        index=pd.Index(accounts, name=account_col),
+    )
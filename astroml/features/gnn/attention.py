@@ -5,13 +5,20 @@ Graph Attention Network (GAT) layer with multi-head attention and exportable att
 
 - Multi-head attention supported via heads parameter
 - Attention weights can be returned from forward(return_attention=True)
-  and are also stored on the module (layer.last_attention_) for export/inspection.
+  and are also stored on the module (layer.last_attention_) for export/inspection
+  whenever return_attention=True or the layer was built with
+  export_attention_enabled=True.
 
 API
 ---
-GATConv(in_dim, out_dim, heads=4, concat=True, dropout=0.0, negative_slope=0.2)
+GATConv(in_dim, out_dim, heads=4, concat=True, dropout=0.0, negative_slope=0.2,
+        compile_forward=False, export_attention_enabled=False)
   forward(x, edge_index, return_attention=False) -> output or (output, attn)
 
+  compile_forward=True wraps the tensor body with torch.compile on first call so the
+  elementwise/softmax chain is fused into few kernels (requires a working
+  TorchInductor toolchain).
+
 Inputs
 ------
 - x: Tensor [N, in_dim]
@@ -25,12 +32,11 @@ Outputs
 Notes
 -----
 - This implementation avoids external deps (PyG, torch-scatter) for portability.
-  Softmax normalization over incoming edges is computed using per-node masking. This
-  is efficient enough for small/medium graphs and unit tests. Replace the
-  segment operations with scatter-based reductions for large graphs when needed.
+  Softmax normalization over incoming edges is computed with native torch scatter
+  reductions (scatter_reduce_/scatter_add_), so no Python loop runs over nodes.
 """
 
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 
 import torch
 from torch import nn
@@ -44,23 +50,20 @@ def _segment_softmax(scores: torch.Tensor, dst: torch.Tensor, num_nodes: int) ->
     dst: [E]
     returns: [E, H] where for each head h and node v: sum_{e: dst_e=v} softmax_h(e) = 1
     """
-    attn = torch.zeros_like(scores)
     if scores.numel() == 0:
-        return attn
-    # Iterate distinct destination nodes present in edges
-    for v in dst.unique():
-        mask = dst == v
-        s = scores[mask]  # [E_v, H]
-        # Numerically stable softmax per head
-        s_max = s.max(dim=0, keepdim=True).values
-        exp_s = (s - s_max).exp()
-        denom = exp_s.sum(dim=0, keepdim=True).clamp_min(1e-9)
-        attn[mask] = exp_s / denom
-    return attn
+        return torch.zeros_like(scores)
+    H = scores.size(1)
+    index = dst.unsqueeze(-1).expand(-1, H)  # [E, H]
+    # Numerically stable softmax per head: subtract the per-node max
+    node_max = scores.new_full((num_nodes, H), float("-inf"))
+    node_max.scatter_reduce_(0, index, scores, reduce="amax", include_self=True)
+    exp_s = (scores - node_max[dst]).exp()
+    denom = scores.new_zeros((num_nodes, H)).scatter_add_(0, index, exp_s)
+    return exp_s / denom[dst].clamp_min(1e-9)
 
 
 def _aggregate_sum_by_dst(messages: torch.Tensor, dst: torch.Tensor, num_nodes: int) -> torch.Tensor:
-    """Sum messages per destination node using simple masking aggregation.
+    """Sum messages per destination node with a single index_add_.
 
     messages: [E, H, F]
     dst: [E]
@@ -70,9 +73,7 @@ def _aggregate_sum_by_dst(messages: torch.Tensor, dst: torch.Tensor, num_nodes:
     out = messages.new_zeros((N, H, Fdim))
     if messages.numel() == 0:
         return out
-    for v in dst.unique():
-        mask = dst == v
-        out[v] = messages[mask].sum(dim=0)
+    out.index_add_(0, dst, messages)
     return out
 
 
@@ -86,6 +87,8 @@ class GATConv(nn.Module):
         dropout: float = 0.0,
         negative_slope: float = 0.2,
         bias: bool = True,
+        compile_forward: bool = False,
+        export_attention_enabled: bool = False,
     ) -> None:
         super().__init__()
         self.in_dim = in_dim
@@ -94,11 +97,13 @@ class GATConv(nn.Module):
         self.concat = concat
         self.dropout = dropout
         self.negative_slope = negative_slope
+        # torch.compile the tensor body lazily on first forward when requested
+        self.compile_forward = compile_forward
+        self._compiled_forward: Optional[Callable[..., Tuple[torch.Tensor, torch.Tensor]]] = None
 
         self.lin = nn.Linear(in_dim, heads * out_dim, bias=False)
         # Attention vector per head over concatenated [Wh_i || Wh_j]
         self.att = nn.Parameter(torch.empty(heads, 2 * out_dim))
-        self.attn_dropout = nn.Dropout(dropout) if dropout > 0 else nn.Identity()
 
         if bias:
             self.bias = nn.Parameter(torch.zeros(out_dim * heads if concat else out_dim))
@@ -107,7 +112,9 @@ class GATConv(nn.Module):
 
         self.reset_parameters()
 
-        # Store last attention for export: tuple(edge_index, attn [E, H])
+        # Store last attention for export: tuple(edge_index, attn [E, H]). Saving is
+        # opt-in so training loops do not keep an extra reference per step.
+        self.export_attention_enabled = export_attention_enabled
         self.last_attention_: Optional[Tuple[torch.Tensor, torch.Tensor]] = None
 
     def reset_parameters(self) -> None:
@@ -128,26 +135,59 @@ class GATConv(nn.Module):
         edge_index: [2, E] where rows are [src, dst]
         return_attention: if True, also return attn weights [E, heads]
         """
-        N = x.size(0)
         assert edge_index.dim() == 2 and edge_index.size(0) == 2, "edge_index must be [2, E]"
+
+        if self.compile_forward:
+            if self._compiled_forward is None:
+                self._compiled_forward = torch.compile(
+                    self._forward_impl, mode="reduce-overhead", fullgraph=True
+                )
+            out, alpha = self._compiled_forward(x, edge_index)
+        else:
+            out, alpha = self._forward_impl(x, edge_index)
+
+        # Save last attention for export; clone because CUDA-graph replays of the
+        # compiled forward reuse (and overwrite) its output buffers
+        if self.export_attention_enabled or return_attention:
+            self.last_attention_ = (edge_index, alpha.detach().clone())
+
+        if return_attention:
+            return out, alpha
+        return out
+
+    def _forward_impl(
+        self,
+        x: torch.Tensor,
+        edge_index: torch.Tensor,
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Tensor-only body of forward, kept free of Python side effects so it traces."""
+        N = x.size(0)
         src, dst = edge_index[0], edge_index[1]
-        E = edge_index.size(1)
 
         Wh = self.lin(x)  # [N, H*F]
         Wh = Wh.view(N, self.heads, self.out_dim)  # [N, H, F]
 
-        # Prepare per-edge head features
-        Wh_i = Wh[src]  # [E, H, F]
-        Wh_j = Wh[dst]  # [E, H, F]
-
-        # Compute attention logits per edge per head
-        # [E, H, 2F] * [H, 2F] -> [E, H]
-        cat_ij = torch.cat([Wh_i, Wh_j], dim=-1)  # [E, H, 2F]
-        att_logits = F.leaky_relu((cat_ij * self.att).sum(dim=-1), negative_slope=self.negative_slope)  # [E, H]
+        # Prepare per-edge head features. Only the source side is gathered: the
+        # destination side enters the logits through alpha_dst below.
+        Wh_i = Wh.index_select(0, src)  # [E, H, F]
+
+        # Compute attention logits per edge per head. a^T [Wh_i || Wh_j] splits into
+        # a_src^T Wh_i + a_dst^T Wh_j, so score nodes once and gather per edge
+        # instead of materializing the [E, H, 2F] concatenation.
+        att_src = self.att[:, :self.out_dim]  # [H, F]
+        att_dst = self.att[:, self.out_dim:]  # [H, F]
+        alpha_src = (Wh * att_src).sum(dim=-1)  # [N, H]
+        alpha_dst = (Wh * att_dst).sum(dim=-1)  # [N, H]
+        att_logits = F.leaky_relu(
+            alpha_src.index_select(0, src) + alpha_dst.index_select(0, dst),
+            negative_slope=self.negative_slope,
+        )  # [E, H]
 
         # Normalize over incoming edges per node for each head
         alpha = _segment_softmax(att_logits, dst, N)  # [E, H]
-        alpha = self.attn_dropout(alpha)
+        if self.training and self.dropout > 0:
+            # In place: alpha is a fresh softmax buffer, so skip another [E, H] allocation
+            alpha = F.dropout(alpha, p=self.dropout, training=True, inplace=True)
 
         # Message passing: weighted sum of neighbor features
         messages = alpha.unsqueeze(-1) * Wh_i  # [E, H, F]
@@ -161,16 +201,14 @@ class GATConv(nn.Module):
         if self.bias is not None:
             out = out + self.bias
 
-        # Save last attention for export
-        self.last_attention_ = (edge_index.detach().clone(), alpha.detach().clone())
-
-        if return_attention:
-            return out, alpha
-        return out
+        return out, alpha
 
     def export_attention(self) -> Optional[Tuple[torch.Tensor, torch.Tensor]]:
         """Return the last computed (edge_index, attention) or None if not computed yet.
 
+        Only populated by forwards run with return_attention=True or while
+        export_attention_enabled is set.
+
         - edge_index: [2, E] LongTensor
         - attention: [E, heads] FloatTensor
         """
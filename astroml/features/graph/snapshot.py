@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Set, Tuple
 import bisect
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Dict, Iterable, List, Sequence, Set, Tuple, Union
+
+import numpy as np
 
+_timestamp = attrgetter("timestamp")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Edge:
     src: str
     dst: str
@@ -16,45 +21,103 @@ class Edge:
 def _ensure_sorted_by_ts(edges: Sequence[Edge]) -> List[Edge]:
     if len(edges) <= 1:
         return list(edges)
+    ts = np.fromiter((e.timestamp for e in edges), dtype=np.int64, count=len(edges))
     # Fast path: check if already non-decreasing by timestamp
-    is_sorted = all(edges[i].timestamp <= edges[i + 1].timestamp for i in range(len(edges) - 1))
-    if is_sorted:
+    if np.all(ts[1:] >= ts[:-1]):
         return list(edges)
-    return sorted(edges, key=lambda e: e.timestamp)
+    # Stable so edges sharing a timestamp keep their input order, as sorted() did
+    order = np.argsort(ts, kind="stable")
+    return [edges[i] for i in order]
+
+
+class SnapshotStore:
+    """Struct-of-arrays view over a timestamp-sorted edge list.
+
+    Build once and reuse for many window queries over the same edges: timestamps
+    and interned node ids live in contiguous int64 arrays, so each query is a
+    pair of binary searches plus a C-level unique over the window.
+
+    - ts/src/dst: int64 arrays aligned with `edges`
+    - id_to_str: node id for each interned integer code
+    """
+
+    def __init__(self, edges: Sequence[Edge], presorted: bool = True) -> None:
+        self.edges: List[Edge] = list(edges) if presorted else _ensure_sorted_by_ts(edges)
+        n = len(self.edges)
+        str_to_id: Dict[str, int] = {}
+
+        def intern(node: str) -> int:
+            return str_to_id.setdefault(node, len(str_to_id))
+
+        self.ts = np.fromiter((e.timestamp for e in self.edges), dtype=np.int64, count=n)
+        self.src = np.fromiter((intern(e.src) for e in self.edges), dtype=np.int64, count=n)
+        self.dst = np.fromiter((intern(e.dst) for e in self.edges), dtype=np.int64, count=n)
+        self.id_to_str: List[str] = list(str_to_id)
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+    def window_ids(self, start_ts: int, end_ts: int) -> Tuple[np.ndarray, slice]:
+        """Return (node codes, edge positions) within [start_ts, end_ts] inclusive.
+
+        Array form of `window` for callers that stay on integer ids: sorted
+        unique node codes (see `id_to_str`) and the slice of `edges`/`ts`/
+        `src`/`dst` inside the window. No Edge or str objects are touched.
+        """
+        if start_ts > end_ts:
+            raise ValueError("start_ts must be <= end_ts")
+        left = int(np.searchsorted(self.ts, start_ts, side="left"))
+        right_exclusive = int(np.searchsorted(self.ts, end_ts, side="right"))
+        if left >= right_exclusive:
+            return np.empty(0, dtype=np.int64), slice(left, left)
+        codes = np.unique(
+            np.concatenate([self.src[left:right_exclusive], self.dst[left:right_exclusive]])
+        )
+        return codes, slice(left, right_exclusive)
+
+    def window(self, start_ts: int, end_ts: int) -> Tuple[Set[str], List[Edge]]:
+        """Return (nodes, edges) within [start_ts, end_ts] inclusive."""
+        codes, span = self.window_ids(start_ts, end_ts)
+        id_to_str = self.id_to_str
+        return {id_to_str[c] for c in codes.tolist()}, self.edges[span]
 
 
 def window_snapshot(
-    edges: Sequence[Edge],
+    edges: Union[Sequence[Edge], SnapshotStore],
     start_ts: int,
     end_ts: int,
     presorted: bool = True,
 ) -> Tuple[Set[str], List[Edge]]:
     """Return induced subgraph (nodes, edges) within [start_ts, end_ts] inclusive.
 
-    - edges: sequence of Edge
+    - edges: sequence of Edge, or a SnapshotStore built once for repeated queries
     - start_ts/end_ts: inclusive window bounds (epoch seconds)
     - presorted: if True, assume edges are sorted by timestamp ascending; otherwise we will sort once.
+      Ignored for a SnapshotStore, which is always sorted.
 
     Efficiency:
-      Uses binary search to find left/right indices and then slices, O(log N + K).
+      Uses binary search to find left/right indices and then slices, O(log N + K)
+      for presorted input.
     """
     if start_ts > end_ts:
         raise ValueError("start_ts must be <= end_ts")
 
-    sorted_edges = list(edges) if presorted else _ensure_sorted_by_ts(edges)
+    if isinstance(edges, SnapshotStore):
+        return edges.window(start_ts, end_ts)
 
-    # Build an array of timestamps for bisect, referencing the same order.
-    ts = [e.timestamp for e in sorted_edges]
+    sorted_edges = edges if presorted else _ensure_sorted_by_ts(edges)
 
+    # Binary search on the edges' own timestamps: O(log N) attribute reads, no
+    # per-call timestamp array. Build a SnapshotStore for repeated queries.
     # Left bound: first index with timestamp >= start_ts
-    left = bisect.bisect_left(ts, start_ts)
+    left = bisect.bisect_left(sorted_edges, start_ts, key=_timestamp)
     # Right bound: last index with timestamp <= end_ts -> use bisect_right and subtract 1
-    right_exclusive = bisect.bisect_right(ts, end_ts)
+    right_exclusive = bisect.bisect_right(sorted_edges, end_ts, key=_timestamp)
 
     if left >= right_exclusive:
         return set(), []
 
-    window_edges = sorted_edges[left:right_exclusive]
+    window_edges = list(sorted_edges[left:right_exclusive])
 
     nodes: Set[str] = set()
     for e in window_edges:
@@ -65,7 +128,7 @@ def window_snapshot(
 
 
 def snapshot_last_n_days(
-    edges: Sequence[Edge],
+    edges: Union[Sequence[Edge], SnapshotStore],
     now_ts: int,
     days: int = 30,
     presorted: bool = True,
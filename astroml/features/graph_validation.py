@@ -4,12 +4,51 @@ This module provides validation and sanity checks for graph structures,
 ensuring data quality before training ML models. It checks for isolated nodes,
 edge consistency, and provides summary statistics.
 """
-from typing import Dict, List, Optional, Set, Tuple, Union
+from functools import cached_property
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+import logging
 import warnings
 
 import numpy as np
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow  # type: ignore  # noqa: F401
+except Exception:  # pragma: no cover
+    pyarrow = None  # Fallback to object/python-backed strings
+
+try:
+    from scipy.sparse import coo_matrix  # type: ignore
+    from scipy.sparse.csgraph import connected_components  # type: ignore
+except Exception:  # pragma: no cover
+    connected_components = None  # Fallback to NumPy label propagation
+
+try:
+    import numba  # type: ignore
+except Exception:  # pragma: no cover
+    numba = None  # Fallback to the NumPy implementation
+
+# Below this many edges the JIT dispatch overhead outweighs the fused scan
+_NUMBA_MIN_SIZE = 100_000
+
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _edge_scan_kernel(src, dst, weights):
+        # One pass for self-loops and negative weights; an empty weights
+        # array means no weight column
+        has_weights = weights.shape[0] == src.shape[0]
+        self_loops = 0
+        negative = 0
+        for i in numba.prange(src.shape[0]):
+            if src[i] == dst[i]:
+                self_loops += 1
+            if has_weights and weights[i] < 0:
+                negative += 1
+        return self_loops, negative
+
 
 class GraphValidationError(Exception):
     """Raised when graph validation fails critically."""
@@ -21,9 +60,211 @@ class GraphValidationWarning(UserWarning):
     pass
 
 
-def check_isolated_nodes(
+class GraphView:
+    """An edge frame with its node factorization computed once and cached.
+
+    Every check in this module accepts either a DataFrame or a GraphView.
+    Building one view and passing it to several checks (as `validate_graph`
+    does) factorizes the endpoint columns and counts degrees only once.
+
+    String node IDs are best supplied as ``"string[pyarrow]"`` columns; when
+    pyarrow is installed, object-dtype string columns are converted to it
+    before factorizing.
+
+    Args:
+        edges: DataFrame containing edge list with source and target columns.
+        source_col: Name of the source node column.
+        target_col: Name of the target node column.
+
+    Raises:
+        KeyError: If required columns are missing.
+    """
+
+    def __init__(self, edges: pd.DataFrame, source_col: str = "source", target_col: str = "target"):
+        if source_col not in edges.columns or target_col not in edges.columns:
+            raise KeyError(f"DataFrame must contain '{source_col}' and '{target_col}' columns")
+        self.edges = edges
+        self.source_col = source_col
+        self.target_col = target_col
+        self._weight_arrays: Dict[str, np.ndarray] = {}
+
+    @cached_property
+    def _factorized(self) -> Tuple[np.ndarray, pd.Index]:
+        # One shared code space for both columns; nulls get a code of their own
+        both = pd.concat([self.edges[self.source_col], self.edges[self.target_col]], ignore_index=True)
+        return pd.factorize(_arrow_strings(both), use_na_sentinel=False)
+
+    @property
+    def codes(self) -> np.ndarray:
+        """Node codes for every source followed by every target."""
+        return self._factorized[0]
+
+    @property
+    def src_codes(self) -> np.ndarray:
+        return self.codes[:len(self.edges)]
+
+    @property
+    def dst_codes(self) -> np.ndarray:
+        return self.codes[len(self.edges):]
+
+    @property
+    def unique_nodes(self) -> pd.Index:
+        """Nodes in first-appearance order; position i has code i."""
+        return self._factorized[1]
+
+    @cached_property
+    def out_deg(self) -> np.ndarray:
+        return np.bincount(self.src_codes, minlength=len(self.unique_nodes))
+
+    @cached_property
+    def in_deg(self) -> np.ndarray:
+        return np.bincount(self.dst_codes, minlength=len(self.unique_nodes))
+
+    @cached_property
+    def packed_edges(self) -> Optional[np.ndarray]:
+        """Each (src, dst) code pair packed into one uint64, or None past 2**32 nodes."""
+        if len(self.unique_nodes) > 2**32:
+            return None
+        return (self.src_codes.astype(np.uint64) << np.uint64(32)) | self.dst_codes.astype(np.uint64)
+
+    def weights(self, weight_col: str) -> np.ndarray:
+        """A weight column as float64, with nulls as NaN, converted once per view."""
+        if weight_col not in self._weight_arrays:
+            if weight_col not in self.edges.columns:
+                raise KeyError(f"Weight column '{weight_col}' not found in DataFrame")
+            self._weight_arrays[weight_col] = self.edges[weight_col].to_numpy(dtype=np.float64, na_value=np.nan)
+        return self._weight_arrays[weight_col]
+
+    @cached_property
+    def component_labels(self) -> np.ndarray:
+        """Weakly connected component label for every node code."""
+        return _component_labels(self.src_codes, self.dst_codes, len(self.unique_nodes))
+
+
+def _component_labels(src: np.ndarray, dst: np.ndarray, num_nodes: int) -> np.ndarray:
+    """Label nodes by weakly connected component (labels are not contiguous)."""
+    if connected_components is not None:
+        adjacency = coo_matrix(
+            (np.ones(len(src), dtype=np.int8), (src, dst)), shape=(num_nodes, num_nodes)
+        ).tocsr()
+        return connected_components(adjacency, directed=False, return_labels=True)[1]
+
+    # Hook each edge's roots onto the smaller one, then compress every
+    # node straight to its root, until no edge joins two roots
+    labels = np.arange(num_nodes)
+    while True:
+        low = np.minimum(labels[src], labels[dst])
+        hooked = labels.copy()
+        np.minimum.at(hooked, labels[src], low)
+        np.minimum.at(hooked, labels[dst], low)
+        while True:
+            parents = hooked[hooked]
+            if np.array_equal(parents, hooked):
+                break
+            hooked = parents
+        if np.array_equal(hooked, labels):
+            return labels
+        labels = hooked
+
+
+def _arrow_strings(values: pd.Series) -> pd.Series:
+    """Convert an all-string object Series to Arrow strings when pyarrow is available."""
+    if pyarrow is not None and values.dtype == object and pd.api.types.infer_dtype(values) == "string":
+        return values.astype("string[pyarrow]")
+    return values
+
+
+def _as_view(edges: Union[pd.DataFrame, GraphView], source_col: str, target_col: str) -> GraphView:
+    if isinstance(edges, GraphView):
+        return edges
+    return GraphView(edges, source_col, target_col)
+
+
+def encode_graph(
     edges: pd.DataFrame,
-    all_nodes: Optional[Set[str]] = None,
+    source_col: str = "source",
+    target_col: str = "target",
+) -> Tuple[pd.DataFrame, pd.Index]:
+    """Replace node IDs with int64 codes shared by both endpoint columns.
+
+    Every check in this module accepts the encoded frame unchanged and runs
+    faster on integer keys, so large graphs with string IDs are best encoded
+    once up front. Map codes back to IDs with ``node_index[code]``, and encode
+    an ``all_nodes`` collection with ``node_index.get_indexer(...)``.
+
+    Args:
+        edges: DataFrame containing edge list with source and target columns.
+        source_col: Name of the source node column.
+        target_col: Name of the target node column.
+
+    Returns:
+        Tuple of (encoded_edges, node_index). Null endpoints stay null, in
+        which case the encoded columns use the nullable ``Int64`` dtype.
+
+    Raises:
+        KeyError: If required columns are missing.
+
+    Examples:
+        >>> edges = pd.DataFrame({"source": ["A", "B"], "target": ["B", "C"]})
+        >>> encoded, node_index = encode_graph(edges)
+        >>> encoded["source"].tolist(), list(node_index)
+        ([0, 1], ['A', 'B', 'C'])
+    """
+    if source_col not in edges.columns or target_col not in edges.columns:
+        raise KeyError(f"DataFrame must contain '{source_col}' and '{target_col}' columns")
+
+    n = len(edges)
+    both = pd.concat([edges[source_col], edges[target_col]], ignore_index=True)
+    codes, uniques = pd.factorize(_arrow_strings(both))
+    codes = codes.astype(np.int64)
+    if (codes < 0).any():
+        # Keep nulls visible to check_edge_consistency
+        encoded = pd.array(codes, dtype="Int64")
+        encoded[codes < 0] = pd.NA
+    else:
+        encoded = codes
+
+    index = edges.index
+    encoded_edges = edges.assign(**{
+        source_col: pd.Series(encoded[:n], index=index),
+        target_col: pd.Series(encoded[n:], index=index),
+    })
+    return encoded_edges, pd.Index(uniques)
+
+
+def _find_isolated_nodes(
+    view: GraphView,
+    all_nodes: Optional[Union[Set[str], np.ndarray, pd.Index]],
+) -> Tuple[Set[str], Set[str]]:
+    """Connected and isolated node sets, without raising or warning."""
+    if not len(view.edges):
+        # No edges: every expected node is isolated, nothing to factorize
+        if all_nodes is None:
+            return set(), set()
+        if isinstance(all_nodes, (np.ndarray, pd.Index)):
+            return set(), set(pd.Index(all_nodes).tolist())
+        return set(), set(all_nodes)
+
+    # Get all nodes that appear in edges
+    connected_nodes = set(view.unique_nodes.tolist())
+
+    # Determine isolated nodes
+    if isinstance(all_nodes, (np.ndarray, pd.Index)):
+        # Hash lookup of each distinct node against the edge nodes' index
+        candidates = pd.Index(all_nodes).unique()
+        missing = view.unique_nodes.get_indexer(candidates) < 0
+        isolated_nodes = set(candidates[missing].tolist())
+    elif all_nodes is not None:
+        isolated_nodes = {n for n in all_nodes if n not in connected_nodes}
+    else:
+        isolated_nodes = set()
+
+    return connected_nodes, isolated_nodes
+
+
+def check_isolated_nodes(
+    edges: Union[pd.DataFrame, GraphView],
+    all_nodes: Optional[Union[Set[str], np.ndarray, pd.Index]] = None,
     source_col: str = "source",
     target_col: str = "target",
     allow_isolated: bool = False,
@@ -31,9 +272,12 @@ def check_isolated_nodes(
     """Check for isolated nodes in the graph.
 
     Args:
-        edges: DataFrame containing edge list with source and target columns.
+        edges: DataFrame containing edge list with source and target columns,
+            or a GraphView (whose own column names are then used).
         all_nodes: Optional set of all nodes that should exist in the graph.
-            If None, only nodes appearing in edges are considered.
+            A NumPy array or pandas Index is looked up against the edge
+            nodes' index in one vectorized pass instead. If None, only nodes appearing in
+            edges are considered.
         source_col: Name of the source node column.
         target_col: Name of the target node column.
         allow_isolated: If False, raises an error when isolated nodes are found.
@@ -54,17 +298,8 @@ def check_isolated_nodes(
         >>> isolated
         {'D'}
     """
-    if source_col not in edges.columns or target_col not in edges.columns:
-        raise KeyError(f"DataFrame must contain '{source_col}' and '{target_col}' columns")
-
-    # Get all nodes that appear in edges
-    connected_nodes = set(edges[source_col].unique()) | set(edges[target_col].unique())
-
-    # Determine isolated nodes
-    if all_nodes is not None:
-        isolated_nodes = all_nodes - connected_nodes
-    else:
-        isolated_nodes = set()
+    view = _as_view(edges, source_col, target_col)
+    connected_nodes, isolated_nodes = _find_isolated_nodes(view, all_nodes)
 
     if isolated_nodes and not allow_isolated:
         raise GraphValidationError(
@@ -79,8 +314,67 @@ def check_isolated_nodes(
     return connected_nodes, isolated_nodes
 
 
+def _edge_consistency_counts(view: GraphView, weight_col: Optional[str]) -> Dict[str, int]:
+    """Count nulls, self-loops, duplicates and negative weights without raising."""
+    edges = view.edges
+    if weight_col is not None and weight_col not in edges.columns:
+        raise KeyError(f"Weight column '{weight_col}' not found in DataFrame")
+
+    results = {'null_values': 0, 'self_loops': 0, 'duplicate_edges': 0}
+    if not len(edges):
+        if weight_col is not None:
+            results['negative_weights'] = 0
+        return results
+
+    # Null values (one pass over both endpoint columns)
+    results['null_values'] = int(np.count_nonzero(edges[[view.source_col, view.target_col]].isnull().to_numpy()))
+
+    if weight_col is not None:
+        weights = view.weights(weight_col)
+
+    # Self-loops (and negative weights, when the fused scan is used)
+    if numba is not None and len(edges) > _NUMBA_MIN_SIZE:
+        self_loops, negative = _edge_scan_kernel(
+            view.src_codes,
+            view.dst_codes,
+            weights if weight_col is not None else np.empty(0),
+        )
+        results['self_loops'] = int(self_loops)
+    else:
+        negative = None
+        results['self_loops'] = int(np.count_nonzero(view.src_codes == view.dst_codes))
+
+    # Duplicate edges on the (src, dst) codes: after a sort, every repeat
+    # sits next to an equal pair
+    packed = view.packed_edges
+    if packed is not None:
+        ordered = np.sort(packed)
+        repeats = ordered[1:] == ordered[:-1]
+    else:
+        order = np.lexsort((view.dst_codes, view.src_codes))
+        src, dst = view.src_codes[order], view.dst_codes[order]
+        repeats = (src[1:] == src[:-1]) & (dst[1:] == dst[:-1])
+    results['duplicate_edges'] = int(np.count_nonzero(repeats))
+
+    # Negative weights if a weight column is provided
+    if weight_col is not None:
+        if negative is None:
+            negative = np.count_nonzero(weights < 0)
+        results['negative_weights'] = int(negative)
+
+    return results
+
+
+def _warn_negative_weights(results: Dict[str, int]) -> None:
+    if results.get('negative_weights', 0) > 0:
+        warnings.warn(
+            f"Found {results['negative_weights']} edges with negative weights",
+            GraphValidationWarning
+        )
+
+
 def check_edge_consistency(
-    edges: pd.DataFrame,
+    edges: Union[pd.DataFrame, GraphView],
     source_col: str = "source",
     target_col: str = "target",
     weight_col: Optional[str] = None,
@@ -90,7 +384,7 @@ def check_edge_consistency(
     """Validate edge consistency in the graph.
 
     Args:
-        edges: DataFrame containing edge list.
+        edges: DataFrame containing edge list, or a GraphView built from one.
         source_col: Name of the source node column.
         target_col: Name of the target node column.
         weight_col: Optional name of edge weight column to check for validity.
@@ -117,59 +411,119 @@ def check_edge_consistency(
         >>> result['self_loops']
         2
     """
-    if source_col not in edges.columns or target_col not in edges.columns:
-        raise KeyError(f"DataFrame must contain '{source_col}' and '{target_col}' columns")
-
-    results = {}
+    results = _edge_consistency_counts(_as_view(edges, source_col, target_col), weight_col)
+    _raise_on_edge_failures(results, allow_self_loops, allow_duplicates)
+    return results
 
-    # Check for null values
-    null_sources = edges[source_col].isnull().sum()
-    null_targets = edges[target_col].isnull().sum()
-    results['null_values'] = int(null_sources + null_targets)
 
+def _raise_on_edge_failures(
+    results: Dict[str, int],
+    allow_self_loops: bool,
+    allow_duplicates: bool,
+) -> None:
     if results['null_values'] > 0:
         raise GraphValidationError(
             f"Found {results['null_values']} null values in edge columns"
         )
 
-    # Check for self-loops
-    self_loop_mask = edges[source_col] == edges[target_col]
-    results['self_loops'] = int(self_loop_mask.sum())
-
     if results['self_loops'] > 0 and not allow_self_loops:
         raise GraphValidationError(
             f"Found {results['self_loops']} self-loop edges (not allowed)"
         )
 
-    # Check for duplicate edges
-    edge_pairs = edges[[source_col, target_col]]
-    duplicates = edge_pairs.duplicated()
-    results['duplicate_edges'] = int(duplicates.sum())
-
     if results['duplicate_edges'] > 0 and not allow_duplicates:
         raise GraphValidationError(
             f"Found {results['duplicate_edges']} duplicate edges (not allowed)"
         )
 
-    # Check weights if provided
-    if weight_col is not None:
-        if weight_col not in edges.columns:
-            raise KeyError(f"Weight column '{weight_col}' not found in DataFrame")
+    _warn_negative_weights(results)
+
+
+def check_edge_consistency_streaming(
+    batches: Iterable[pd.DataFrame],
+    source_col: str = "source",
+    target_col: str = "target",
+    weight_col: Optional[str] = None,
+    allow_self_loops: bool = True,
+    allow_duplicates: bool = False,
+) -> Dict[str, int]:
+    """Validate edge consistency over an edge list delivered in batches.
+
+    Gives the same counts as `check_edge_consistency` on the concatenated
+    batches, but only one batch is held in memory at a time, e.g. the
+    chunks of ``pd.read_csv(path, chunksize=1_000_000)``. Duplicates are
+    also detected across batches; for that the function keeps every
+    distinct node once and every distinct edge as one packed uint64.
+
+    Args:
+        batches: Iterable of DataFrames with the same edge columns.
+        source_col: Name of the source node column.
+        target_col: Name of the target node column.
+        weight_col: Optional name of edge weight column to check for validity.
+        allow_self_loops: If False, raises error when self-loops are found.
+        allow_duplicates: If False, raises error when duplicate edges exist.
 
-        negative_weights = (edges[weight_col] < 0).sum()
-        results['negative_weights'] = int(negative_weights)
+    Returns:
+        Dictionary with the same keys as `check_edge_consistency`.
 
-        if results['negative_weights'] > 0:
-            warnings.warn(
-                f"Found {results['negative_weights']} edges with negative weights",
-                GraphValidationWarning
-            )
+    Raises:
+        GraphValidationError: If validation fails based on parameters.
+        KeyError: If required columns are missing from a batch.
+        ValueError: If the batches hold more than 2**32 distinct nodes.
 
+    Examples:
+        >>> batches = [
+        ...     pd.DataFrame({"source": ["A", "B"], "target": ["B", "C"]}),
+        ...     pd.DataFrame({"source": ["A"], "target": ["B"]}),
+        ... ]
+        >>> check_edge_consistency_streaming(batches, allow_duplicates=True)['duplicate_edges']
+        1
+    """
+    results = {'null_values': 0, 'self_loops': 0, 'duplicate_edges': 0}
+    if weight_col is not None:
+        results['negative_weights'] = 0
+
+    nodes: Optional[pd.Index] = None
+    seen = np.empty(0, dtype=np.uint64)  # sorted distinct edge keys so far
+
+    for batch in batches:
+        view = GraphView(batch, source_col, target_col)
+        counts = _edge_consistency_counts(view, weight_col)
+
+        # Move the batch's node codes into the running code space
+        local = view.unique_nodes
+        if nodes is None:
+            nodes = local
+            to_global = np.arange(len(local))
+        else:
+            to_global = nodes.get_indexer(local)
+            new = to_global < 0
+            to_global[new] = np.arange(len(nodes), len(nodes) + np.count_nonzero(new))
+            nodes = nodes.append(local[new])
+        if len(nodes) > 2**32:
+            raise ValueError("Streaming duplicate detection supports at most 2**32 nodes")
+
+        src = to_global[view.src_codes].astype(np.uint64)
+        dst = to_global[view.dst_codes].astype(np.uint64)
+        keys = np.unique((src << np.uint64(32)) | dst)
+
+        # Repeats within the batch, then distinct keys already seen earlier
+        pos = np.searchsorted(seen, keys)
+        known = np.zeros(len(keys), dtype=bool)
+        if len(seen):
+            known = seen[np.minimum(pos, len(seen) - 1)] == keys
+        counts['duplicate_edges'] = len(batch) - len(keys) + int(np.count_nonzero(known))
+        seen = np.insert(seen, pos[~known], keys[~known])
+
+        for name, count in counts.items():
+            results[name] += count
+
+    _raise_on_edge_failures(results, allow_self_loops, allow_duplicates)
     return results
 
 
 def graph_summary_statistics(
-    edges: pd.DataFrame,
+    edges: Union[pd.DataFrame, GraphView],
     source_col: str = "source",
     target_col: str = "target",
     weight_col: Optional[str] = None,
@@ -177,7 +531,7 @@ def graph_summary_statistics(
     """Generate summary statistics for the graph.
 
     Args:
-        edges: DataFrame containing edge list.
+        edges: DataFrame containing edge list, or a GraphView built from one.
         source_col: Name of the source node column.
         target_col: Name of the target node column.
         weight_col: Optional name of edge weight column for weight statistics.
@@ -191,6 +545,8 @@ def graph_summary_statistics(
             - 'density': Graph density (edges / possible_edges)
             - 'avg_degree': Average node degree
             - 'degree_stats': Dict with min, max, median, std of degrees
+            - 'num_components': Number of weakly connected components
+            - 'largest_component_size': Nodes in the largest such component
             - 'weight_stats': Dict with weight statistics (if weight_col provided)
 
     Examples:
@@ -202,62 +558,137 @@ def graph_summary_statistics(
         >>> stats['num_nodes']
         3
     """
-    if source_col not in edges.columns or target_col not in edges.columns:
-        raise KeyError(f"DataFrame must contain '{source_col}' and '{target_col}' columns")
+    return _summary_statistics(_as_view(edges, source_col, target_col), weight_col)
 
+
+def _summary_statistics(view: GraphView, weight_col: Optional[str]) -> Dict[str, Union[int, float, Dict]]:
+    edges = view.edges
+    if not len(edges):
+        return _empty_summary_statistics(edges, weight_col)
     stats = {}
 
-    # Basic counts
+    # Basic counts from the view's shared node codes
     stats['num_edges'] = len(edges)
-    source_nodes = set(edges[source_col].unique())
-    target_nodes = set(edges[target_col].unique())
-    all_nodes = source_nodes | target_nodes
+    num_nodes = len(view.unique_nodes)
+    out_degrees = view.out_deg
+    in_degrees = view.in_deg
 
-    stats['num_nodes'] = len(all_nodes)
-    stats['num_source_nodes'] = len(source_nodes)
-    stats['num_target_nodes'] = len(target_nodes)
+    stats['num_nodes'] = num_nodes
+    stats['num_source_nodes'] = int(np.count_nonzero(out_degrees))
+    stats['num_target_nodes'] = int(np.count_nonzero(in_degrees))
 
     # Graph density
-    num_nodes = stats['num_nodes']
     max_edges = num_nodes * (num_nodes - 1)  # directed graph
     stats['density'] = stats['num_edges'] / max_edges if max_edges > 0 else 0.0
 
-    # Degree statistics
-    out_degrees = edges[source_col].value_counts()
-    in_degrees = edges[target_col].value_counts()
-
-    # Total degree for each node
-    all_degrees = pd.Series(0, index=list(all_nodes))
-    all_degrees = all_degrees.add(out_degrees, fill_value=0).add(in_degrees, fill_value=0)
+    # Degree statistics: total degree for each node
+    all_degrees = out_degrees + in_degrees
 
     stats['avg_degree'] = float(all_degrees.mean())
     stats['degree_stats'] = {
         'min': int(all_degrees.min()),
         'max': int(all_degrees.max()),
-        'median': float(all_degrees.median()),
-        'std': float(all_degrees.std()),
+        'median': float(np.median(all_degrees)),
+        'std': float(all_degrees.std(ddof=1)) if num_nodes > 1 else float('nan'),
     }
 
+    # Weakly connected components
+    component_sizes = np.bincount(view.component_labels)
+    stats['num_components'] = int(np.count_nonzero(component_sizes))
+    stats['largest_component_size'] = int(component_sizes.max())
+
     # Weight statistics if provided
+    if weight_col is not None:
+        # NumPy reductions over the view's float array, skipping nulls as pandas does
+        weights = view.weights(weight_col)
+        weights = weights[~np.isnan(weights)]
+        if weights.size:
+            stats['weight_stats'] = {
+                'min': float(weights.min()),
+                'max': float(weights.max()),
+                'mean': float(weights.mean()),
+                'median': float(np.median(weights)),
+                'std': float(weights.std(ddof=1)) if weights.size > 1 else float('nan'),
+                'sum': float(weights.sum()),
+            }
+        else:
+            stats['weight_stats'] = _null_weight_stats()
+
+    return stats
+
+
+def _null_weight_stats() -> Dict[str, float]:
+    nan = float('nan')
+    return {'min': nan, 'max': nan, 'mean': nan, 'median': nan, 'std': nan, 'sum': 0.0}
+
+
+def _empty_summary_statistics(edges: pd.DataFrame, weight_col: Optional[str]) -> Dict[str, Union[int, float, Dict]]:
+    """Summary of an edge list with no rows, without touching the (empty) columns."""
+    stats = {
+        'num_edges': 0,
+        'num_nodes': 0,
+        'num_source_nodes': 0,
+        'num_target_nodes': 0,
+        'density': 0.0,
+        'avg_degree': 0.0,
+        'degree_stats': {'min': 0, 'max': 0, 'median': 0.0, 'std': 0.0},
+        'num_components': 0,
+        'largest_component_size': 0,
+    }
     if weight_col is not None:
         if weight_col not in edges.columns:
             raise KeyError(f"Weight column '{weight_col}' not found in DataFrame")
+        stats['weight_stats'] = _null_weight_stats()
+    return stats
 
-        weights = edges[weight_col]
-        stats['weight_stats'] = {
-            'min': float(weights.min()),
-            'max': float(weights.max()),
-            'mean': float(weights.mean()),
-            'median': float(weights.median()),
-            'std': float(weights.std()),
-            'sum': float(weights.sum()),
-        }
 
-    return stats
+def _report_lines(
+    summary: Dict,
+    edge_checks: Dict[str, int],
+    isolated_nodes: Set[str],
+    weight_col: Optional[str],
+    compute_summary: bool,
+    validation_passed: bool,
+) -> Iterator[str]:
+    """Lines of the human-readable validation report, formatted lazily."""
+    yield "=" * 60
+    yield "GRAPH VALIDATION REPORT"
+    yield "=" * 60
+    if compute_summary:
+        yield f"\nNodes: {summary['num_nodes']}"
+        yield f"Edges: {summary['num_edges']}"
+        yield f"Density: {summary['density']:.6f}"
+        yield f"Average Degree: {summary['avg_degree']:.2f}"
+        yield f"Components: {summary['num_components']} (largest: {summary['largest_component_size']} nodes)"
+        yield "\nDegree Statistics:"
+        yield f"  Min: {summary['degree_stats']['min']}"
+        yield f"  Max: {summary['degree_stats']['max']}"
+        yield f"  Median: {summary['degree_stats']['median']:.2f}"
+        yield f"  Std: {summary['degree_stats']['std']:.2f}"
+    else:
+        yield f"\nEdges: {summary['num_edges']}"
+
+    if weight_col and 'weight_stats' in summary:
+        yield "\nWeight Statistics:"
+        yield f"  Min: {summary['weight_stats']['min']:.2f}"
+        yield f"  Max: {summary['weight_stats']['max']:.2f}"
+        yield f"  Mean: {summary['weight_stats']['mean']:.2f}"
+        yield f"  Sum: {summary['weight_stats']['sum']:.2f}"
+
+    yield "\nEdge Checks:"
+    yield f"  Self-loops: {edge_checks['self_loops']}"
+    yield f"  Duplicate edges: {edge_checks['duplicate_edges']}"
+    yield f"  Null values: {edge_checks['null_values']}"
+
+    if isolated_nodes:
+        yield f"\nIsolated Nodes: {len(isolated_nodes)}"
+
+    yield f"\nValidation Status: {'PASSED' if validation_passed else 'FAILED'}"
+    yield "=" * 60
 
 
 def validate_graph(
-    edges: pd.DataFrame,
+    edges: Union[pd.DataFrame, GraphView],
     all_nodes: Optional[Set[str]] = None,
     source_col: str = "source",
     target_col: str = "target",
@@ -265,15 +696,18 @@ def validate_graph(
     allow_isolated: bool = False,
     allow_self_loops: bool = True,
     allow_duplicates: bool = False,
-    verbose: bool = True,
+    verbose: bool = False,
+    compute_summary: bool = True,
 ) -> Dict[str, Union[Dict, Set]]:
     """Comprehensive graph validation with all checks.
 
     This is a convenience function that runs all validation checks and
-    returns a comprehensive report.
+    returns a comprehensive report. Every check is evaluated before any
+    error is raised, so a failure reports all violated rules at once; the
+    summary statistics are only computed once the checks have passed.
 
     Args:
-        edges: DataFrame containing edge list.
+        edges: DataFrame containing edge list, or a GraphView built from one.
         all_nodes: Optional set of all nodes that should exist.
         source_col: Name of the source node column.
         target_col: Name of the target node column.
@@ -281,7 +715,10 @@ def validate_graph(
         allow_isolated: If False, raises error for isolated nodes.
         allow_self_loops: If False, raises error for self-loops.
         allow_duplicates: If False, raises error for duplicate edges.
-        verbose: If True, prints validation summary.
+        verbose: If True, prints validation summary. Otherwise the summary is
+            logged at INFO level, and only formatted when that level is enabled.
+        compute_summary: If False, skip graph_summary_statistics and report
+            only ``{'num_edges': ...}`` as the summary.
 
     Returns:
         Dictionary containing:
@@ -302,62 +739,56 @@ def validate_graph(
         >>> report['validation_passed']
         True
     """
+    # One view for every check, so factorization and degrees happen once
+    view = _as_view(edges, source_col, target_col)
+    edges = view.edges
+
     report = {}
 
-    # Run all checks
-    connected_nodes, isolated_nodes = check_isolated_nodes(
-        edges, all_nodes, source_col, target_col, allow_isolated
-    )
+    # Run all checks without raising, then fail once with every violation
+    connected_nodes, isolated_nodes = _find_isolated_nodes(view, all_nodes)
     report['isolated_nodes'] = isolated_nodes
 
-    edge_checks = check_edge_consistency(
-        edges, source_col, target_col, weight_col,
-        allow_self_loops, allow_duplicates
-    )
+    edge_checks = _edge_consistency_counts(view, weight_col)
     report['edge_checks'] = edge_checks
 
-    summary = graph_summary_statistics(edges, source_col, target_col, weight_col)
+    failures = []
+    if isolated_nodes and not allow_isolated:
+        failures.append(f"{len(isolated_nodes)} isolated nodes: {isolated_nodes}")
+    if edge_checks['null_values'] > 0:
+        failures.append(f"{edge_checks['null_values']} null values in edge columns")
+    if edge_checks['self_loops'] > 0 and not allow_self_loops:
+        failures.append(f"{edge_checks['self_loops']} self-loop edges (not allowed)")
+    if edge_checks['duplicate_edges'] > 0 and not allow_duplicates:
+        failures.append(f"{edge_checks['duplicate_edges']} duplicate edges (not allowed)")
+    if failures:
+        raise GraphValidationError("Graph validation failed: " + "; ".join(failures))
+
+    if isolated_nodes:
+        warnings.warn(
+            f"Found {len(isolated_nodes)} isolated nodes",
+            GraphValidationWarning
+        )
+    _warn_negative_weights(edge_checks)
+
+    if compute_summary:
+        summary = _summary_statistics(view, weight_col)
+    else:
+        summary = {'num_edges': len(edges)}
     report['summary'] = summary
 
     # Determine if validation passed
-    validation_passed = (
-        (len(isolated_nodes) == 0 or allow_isolated) and
-        (edge_checks['self_loops'] == 0 or allow_self_loops) and
-        (edge_checks['duplicate_edges'] == 0 or allow_duplicates) and
-        edge_checks['null_values'] == 0
-    )
+    validation_passed = not failures
     report['validation_passed'] = validation_passed
 
     if verbose:
-        print("=" * 60)
-        print("GRAPH VALIDATION REPORT")
-        print("=" * 60)
-        print(f"\nNodes: {summary['num_nodes']}")
-        print(f"Edges: {summary['num_edges']}")
-        print(f"Density: {summary['density']:.6f}")
-        print(f"Average Degree: {summary['avg_degree']:.2f}")
-        print(f"\nDegree Statistics:")
-        print(f"  Min: {summary['degree_stats']['min']}")
-        print(f"  Max: {summary['degree_stats']['max']}")
-        print(f"  Median: {summary['degree_stats']['median']:.2f}")
-        print(f"  Std: {summary['degree_stats']['std']:.2f}")
-
-        if weight_col and 'weight_stats' in summary:
-            print(f"\nWeight Statistics:")
-            print(f"  Min: {summary['weight_stats']['min']:.2f}")
-            print(f"  Max: {summary['weight_stats']['max']:.2f}")
-            print(f"  Mean: {summary['weight_stats']['mean']:.2f}")
-            print(f"  Sum: {summary['weight_stats']['sum']:.2f}")
-
-        print(f"\nEdge Checks:")
-        print(f"  Self-loops: {edge_checks['self_loops']}")
-        print(f"  Duplicate edges: {edge_checks['duplicate_edges']}")
-        print(f"  Null values: {edge_checks['null_values']}")
-
-        if isolated_nodes:
-            print(f"\nIsolated Nodes: {len(isolated_nodes)}")
-
-        print(f"\nValidation Status: {'PASSED' if validation_passed else 'FAILED'}")
-        print("=" * 60)
+        for line in _report_lines(
+            summary, edge_checks, isolated_nodes, weight_col, compute_summary, validation_passed
+        ):
+            print(line)
+    elif logger.isEnabledFor(logging.INFO):
+        logger.info("\n".join(_report_lines(
+            summary, edge_checks, isolated_nodes, weight_col, compute_summary, validation_passed
+        )))
 
     return report
@@ -14,9 +14,31 @@ from typing import Union, Optional
 import numpy as np
 import pandas as pd
 
+try:
+    import numba  # type: ignore
+except Exception:  # pragma: no cover
+    numba = None  # Fallback to the NumPy implementation
+
 Number = Union[float, int]
 ArrayLike = Union[Number, np.ndarray, pd.Series, list, tuple]
 
+# Below this many elements the JIT dispatch overhead outweighs the fused kernel
+_NUMBA_MIN_SIZE = 10_000
+
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _net_flow_ratio_kernel(sent, recv, out, log_scale):
+        # Single fused pass; no fastmath so NaN inputs still propagate
+        for i in numba.prange(sent.shape[0]):
+            s = sent[i]
+            r = recv[i]
+            if log_scale:
+                s = np.log1p(s)
+                r = np.log1p(r)
+            d = s + r
+            out[i] = 0.0 if d == 0 else (s - r) / d
+
 
 def net_flow_ratio(
     sent: ArrayLike,
@@ -32,9 +54,13 @@ def net_flow_ratio(
         sent: Sent amounts (scalar or array-like).
         received: Received amounts (same shape as `sent`).
         log_scale: If True, apply log scaling to amounts before computing
-            the ratio. This is `log_base(log(amount + eps))`.
-        log_base: Base for logarithm when `log_scale` is True.
-        eps: Small epsilon added to amounts before logging to avoid -inf.
+            the ratio. This is `log(1 + amount)`, so zero stays zero and
+            non-negative amounts keep the ratio in [-1, 1].
+        log_base: Unused, since the logarithm's base cancels in the ratio;
+            kept for backward compatibility and still checked to be positive
+            when `log_scale` is True.
+        eps: Unused since log scaling became `log1p`; kept for backward
+            compatibility.
 
     Returns:
         Ratio in [-1, 1]. Returns a scalar if inputs were scalars, a
@@ -63,18 +89,25 @@ def net_flow_ratio(
     if sent_arr.shape != recv_arr.shape:
         raise ValueError("`sent` and `received` must have the same shape")
 
-    if log_scale:
-        if log_base <= 0:
-            raise ValueError("log_base must be positive")
-        sent_arr = np.log(sent_arr + eps) / np.log(log_base)
-        recv_arr = np.log(recv_arr + eps) / np.log(log_base)
+    if log_scale and log_base <= 0:
+        raise ValueError("log_base must be positive")
+
+    if numba is not None and sent_arr.size > _NUMBA_MIN_SIZE:
+        flat_sent = np.ascontiguousarray(sent_arr).ravel()
+        flat_recv = np.ascontiguousarray(recv_arr).ravel()
+        ratio = np.empty_like(flat_sent)
+        _net_flow_ratio_kernel(flat_sent, flat_recv, ratio, log_scale)
+        ratio = ratio.reshape(sent_arr.shape)
+    else:
+        if log_scale:
+            sent_arr = np.log1p(sent_arr)
+            recv_arr = np.log1p(recv_arr)
 
-    num = sent_arr - recv_arr
-    den = sent_arr + recv_arr
+        num = sent_arr - recv_arr
+        den = sent_arr + recv_arr
 
-    # Safe division: when denominator is zero, define ratio to be 0
-    with np.errstate(divide="ignore", invalid="ignore"):
-        ratio = np.where(den == 0, 0.0, num / den)
+        # Safe division: when denominator is zero, define ratio to be 0
+        ratio = np.divide(num, den, out=np.zeros_like(den), where=den != 0)
 
     # If inputs were scalar numbers, return a scalar
     if np.isscalar(sent) or np.isscalar(received):
@@ -98,12 +131,10 @@ def net_flow_ratio_from_transactions(
 ) -> pd.DataFrame:
     """Compute `net_flow_ratio` for each row in a transactions DataFrame.
 
-    This convenience function adds a new column to the DataFrame (a copy is
-    returned) containing the computed ratio.
+    This convenience function returns a new DataFrame with an added column
+    containing the computed ratio; the input frame is not modified.
     """
     if sent_col not in df or received_col not in df:
         raise KeyError(f"DataFrame must contain '{sent_col}' and '{received_col}' columns")
 
-    out = df.copy()
-    out[out_col] = net_flow_ratio(out[sent_col], out[received_col], **kwargs)
-    return out
+    return df.assign(**{out_col: net_flow_ratio(df[sent_col], df[received_col], **kwargs)})
@@ -6,14 +6,22 @@ extracting features for machine learning. Memos can be of type 'text' (string),
 malformed memos gracefully by flagging them and setting invalid values to None.
 
 Features extracted:
-- memo_type: 'text', 'id', 'hash', or 'none'
+- memo_type: 'text', 'id', 'hash', or 'none' (categorical)
 - memo_value: normalized value (string, int, or hex string)
 - memo_length: length of text memos (0 for others)
 - is_malformed: boolean indicating if the memo was malformed
 """
-from typing import Dict, Any, Optional, Union
+import functools
+import re
+from typing import Dict, Any, Optional, Tuple, Union
 import pandas as pd
 
+# Categories of the memo type column produced by extract_memo_features
+MEMO_TYPES = ('text', 'id', 'hash', 'none')
+
+# A hash memo as a string: exactly 64 lowercase hex digits
+_HEX64 = re.compile(r'[0-9a-f]{64}').fullmatch
+
 
 def parse_memo(memo: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     """Parse a single memo dict into structured features.
@@ -35,8 +43,26 @@ def parse_memo(memo: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     if not isinstance(memo, dict) or 'type' not in memo or 'value' not in memo:
         return {'type': 'none', 'value': None, 'is_malformed': True}
 
-    type_ = memo['type'].lower()
-    value = memo['value']
+    type_, value, is_malformed = _parse_memo_fields(memo['type'].lower(), memo['value'])
+    return {'type': type_, 'value': value, 'is_malformed': is_malformed}
+
+
+def _parse_memo_fields(type_: str, value: Any) -> Tuple[str, Any, bool]:
+    """Parse a memo's (lowercased type, value) pair, memoized when hashable."""
+    try:
+        return _parse_memo_cached(type_, type(value), value)
+    except TypeError:
+        # Unhashable value (list, dict, ...): parse without the cache
+        return _parse_memo_uncached(type_, value)
+
+
+@functools.lru_cache(maxsize=100_000)
+def _parse_memo_cached(type_: str, value_type: type, value: Any) -> Tuple[str, Any, bool]:
+    # value_type is part of the key so equal-but-distinct values (1, 1.0, True) never share an entry
+    return _parse_memo_uncached(type_, value)
+
+
+def _parse_memo_uncached(type_: str, value: Any) -> Tuple[str, Any, bool]:
     is_malformed = False
 
     if type_ == 'text':
@@ -57,7 +83,7 @@ def parse_memo(memo: Optional[Dict[str, Any]]) -> Dict[str, Any]:
             value = value.hex()
         elif isinstance(value, str):
             value = value.lower()
-            if len(value) != 64 or not all(c in '0123456789abcdef' for c in value):
+            if _HEX64(value) is None:
                 is_malformed = True
                 value = None
         else:
@@ -68,7 +94,32 @@ def parse_memo(memo: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         type_ = 'none'
         value = None
 
-    return {'type': type_, 'value': value, 'is_malformed': is_malformed}
+    return type_, value, is_malformed
+
+
+def _parse_memo_batch(series: pd.Series):
+    """Parse every memo in ``series`` in a single pass.
+
+    Returns four lists aligned with ``series``: types, values, text lengths and
+    malformed flags.
+    """
+    n = len(series)
+    types = [None] * n
+    values = [None] * n
+    lengths = [0] * n
+    malformed = [False] * n
+    for i, memo in enumerate(series.values):
+        if not isinstance(memo, dict) or 'type' not in memo or 'value' not in memo:
+            types[i] = 'none'
+            malformed[i] = True
+            continue
+        type_, value, is_malformed = _parse_memo_fields(memo['type'].lower(), memo['value'])
+        types[i] = type_
+        values[i] = value
+        if type_ == 'text' and value:
+            lengths[i] = len(value)
+        malformed[i] = is_malformed
+    return types, values, lengths, malformed
 
 
 def extract_memo_features(
@@ -94,14 +145,22 @@ def extract_memo_features(
     if memo_col not in df:
         raise KeyError(f"DataFrame must contain '{memo_col}' column")
 
-    df_out = df.copy()
-    parsed = df_out[memo_col].apply(parse_memo)
-
-    df_out[f'{out_prefix}type'] = parsed.apply(lambda x: x['type'])
-    df_out[f'{out_prefix}value'] = parsed.apply(lambda x: x['value'])
-    df_out[f'{out_prefix}length'] = parsed.apply(
-        lambda x: len(x['value']) if x['type'] == 'text' and x['value'] else 0
+    types, values, lengths, malformed = _parse_memo_batch(df[memo_col])
+
+    # Let pandas infer each column dtype; empty inputs stay object
+    columns = {
+        f'{out_prefix}value': values,
+        f'{out_prefix}length': lengths,
+        f'{out_prefix}is_malformed': malformed,
+    }
+    new_cols = {
+        f'{out_prefix}type': pd.Series(
+            pd.Categorical(types, categories=MEMO_TYPES), index=df.index
+        ),
+    }
+    new_cols.update(
+        (name, pd.Series(col, index=df.index, dtype=None if col else object))
+        for name, col in columns.items()
     )
-    df_out[f'{out_prefix}is_malformed'] = parsed.apply(lambda x: x['is_malformed'])
-
-    return df_out
+    # assign() shares the existing column data instead of deep-copying the frame
+    return df.assign(**new_cols)
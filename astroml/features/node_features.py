@@ -32,79 +32,83 @@ def compute_node_features(
     nodes_first_seen: Optional[Dict[Hashable, float]] = None,
     ref_time: Optional[float] = None,
 ) -> pd.DataFrame:
-    rows_src = []
-    rows_dst = []
+    # Single streaming pass over the edge iterable into flat columns
+    srcs = []
+    dsts = []
+    amts = []
+    tss = []
     max_ts = -np.inf
-
     for e in edges:
+        ts = float(e.get('timestamp', 0.0) or 0.0)
+        # ref_time defaults over all edges, including ones dropped for a missing endpoint
+        if ts > max_ts:
+            max_ts = ts
         src = e.get('src')
         dst = e.get('dst')
-        amt = float(e.get('amount', 0.0) or 0.0)
-        ts = float(e.get('timestamp', 0.0) or 0.0)
-        max_ts = max(max_ts, ts)
         if src is None or dst is None:
             continue
-        rows_src.append((src, amt, ts))
-        rows_dst.append((dst, amt, ts))
-
-    # Build DataFrames for aggregation
-    src_df = pd.DataFrame(rows_src, columns=['node','amount','timestamp'])
-    dst_df = pd.DataFrame(rows_dst, columns=['node','amount','timestamp'])
+        srcs.append(src)
+        dsts.append(dst)
+        amts.append(float(e.get('amount', 0.0) or 0.0))
+        tss.append(ts)
+    amt = np.array(amts, dtype=float)
+    ts = np.array(tss, dtype=float)
 
     if ref_time is None:
         ref_time = float(max_ts if max_ts != -np.inf else 0.0)
 
-    # Degrees
-    out_degree = src_df.groupby('node').size().astype(int).rename('out_degree') if not src_df.empty else pd.Series(dtype=int, name='out_degree')
-    in_degree = dst_df.groupby('node').size().astype(int).rename('in_degree') if not dst_df.empty else pd.Series(dtype=int, name='in_degree')
-
-    # Volumes
-    total_sent = src_df.groupby('node')['amount'].sum().rename('total_sent') if not src_df.empty else pd.Series(dtype=float, name='total_sent')
-    total_received = dst_df.groupby('node')['amount'].sum().rename('total_received') if not dst_df.empty else pd.Series(dtype=float, name='total_received')
+    # Shared integer codes for src and dst so every aggregate is a bincount over one node index
+    m = len(srcs)
+    codes, uniq = pd.factorize(pd.Series(srcs + dsts))
+    code_s, code_d = codes[:m], codes[m:]
+    k = len(uniq)
 
-    # First seen from edges
-    first_seen_src = src_df.groupby('node')['timestamp'].min().rename('first_seen_src') if not src_df.empty else pd.Series(dtype=float, name='first_seen_src')
-    first_seen_dst = dst_df.groupby('node')['timestamp'].min().rename('first_seen_dst') if not dst_df.empty else pd.Series(dtype=float, name='first_seen_dst')
+    out_degree = np.bincount(code_s, minlength=k)
+    in_degree = np.bincount(code_d, minlength=k)
+    total_sent = np.bincount(code_s, weights=amt, minlength=k)
+    total_received = np.bincount(code_d, weights=amt, minlength=k)
 
-    first_seen_edge = pd.concat([first_seen_src, first_seen_dst], axis=1).min(axis=1).rename('first_seen_edge')
+    # First seen from edges: min timestamp per code over both endpoint roles
+    first_seen_edge = np.zeros(k, dtype=float)
+    if k:
+        order = np.argsort(codes, kind='stable')
+        starts = np.flatnonzero(np.r_[True, np.diff(codes[order]) != 0])
+        first_seen_edge = np.minimum.reduceat(np.concatenate([ts, ts])[order], starts)
 
-    # Merge all
-    feats = pd.concat([in_degree, out_degree, total_received, total_sent, first_seen_edge], axis=1).fillna(0)
+    index = pd.Index(uniq, name='node')
+    first_seen = first_seen_edge
 
-    # If external first_seen provided, prefer it where available
+    # External first_seen: prefer it for known nodes, and append nodes that have no edges
     if nodes_first_seen is not None and len(nodes_first_seen) > 0:
-        provided = pd.Series(nodes_first_seen, name='first_seen_provided', dtype=float)
-        feats['first_seen'] = feats['first_seen_edge']
-        feats.loc[feats.index.intersection(provided.index), 'first_seen'] = provided.loc[feats.index.intersection(provided.index)]
-    else:
-        feats['first_seen'] = feats['first_seen_edge']
+        provided = pd.Series(nodes_first_seen, dtype=float)
+        pos = index.get_indexer(provided.index)
+        known = pos >= 0
+        first_seen = first_seen.copy()
+        first_seen[pos[known]] = provided.to_numpy()[known]
 
-    # Account age: ref_time - first_seen; clamp at 0
-    feats['account_age'] = (float(ref_time) - feats['first_seen']).clip(lower=0.0)
-
-    # Finalize columns and dtypes
-    feats = feats.drop(columns=['first_seen_edge'])
-    feats['in_degree'] = feats['in_degree'].astype(int)
-    feats['out_degree'] = feats['out_degree'].astype(int)
-    feats['total_received'] = feats['total_received'].astype(float)
-    feats['total_sent'] = feats['total_sent'].astype(float)
-    feats['account_age'] = feats['account_age'].astype(float)
-
-    # Ensure nodes that appear only in nodes_first_seen (no edges) are included
-    if nodes_first_seen is not None and len(nodes_first_seen) > 0:
-        provided = pd.Series(nodes_first_seen, name='first_seen_provided', dtype=float)
-        missing = provided.index.difference(feats.index)
+        missing = provided[~known]
         if len(missing) > 0:
-            extra = pd.DataFrame(index=missing)
-            extra['in_degree'] = 0
-            extra['out_degree'] = 0
-            extra['total_received'] = 0.0
-            extra['total_sent'] = 0.0
-            extra['first_seen'] = provided.loc[missing]
-            extra['account_age'] = (float(ref_time) - extra['first_seen']).clip(lower=0.0)
-            feats = pd.concat([feats, extra])
-
-    # Order columns
-    feats = feats[['in_degree','out_degree','total_received','total_sent','account_age','first_seen']]
+            pad = np.zeros(len(missing), dtype=np.int64)
+            in_degree = np.concatenate([in_degree, pad])
+            out_degree = np.concatenate([out_degree, pad])
+            total_received = np.concatenate([total_received, pad.astype(float)])
+            total_sent = np.concatenate([total_sent, pad.astype(float)])
+            first_seen = np.concatenate([first_seen, missing.to_numpy()])
+            index = index.append(missing.index)
+
+    # Account age: ref_time - first_seen; clamp at 0
+    account_age = np.clip(float(ref_time) - first_seen, 0.0, None)
+
+    feats = pd.DataFrame(
+        {
+            'in_degree': in_degree.astype(int),
+            'out_degree': out_degree.astype(int),
+            'total_received': total_received.astype(float),
+            'total_sent': total_sent.astype(float),
+            'account_age': account_age.astype(float),
+            'first_seen': first_seen.astype(float),
+        },
+        index=index,
+    )
 
     return feats.sort_index()
@@ -4,23 +4,101 @@ Constructs directed graphs where nodes represent accounts and edges represent
 transactions between them. Supports weighted edges, multi-asset transactions,
 and export to NetworkX format.
 """
-from typing import Dict, List, Optional, Tuple, Any
 from collections import defaultdict
+from typing import Any, Callable, Dict, KeysView, List, Optional, Tuple
+
+import numpy as np
+
+# dtypes of the (src, dst, amount, asset) column buffers
+_COLUMN_DTYPES = (np.int32, np.int32, np.float64, np.int32)
+
+# aggregation -> f(count, total, low, high) over an edge's running statistics
+_EDGE_STAT_AGGREGATIONS: Dict[str, Callable[[int, float, float, float], float]] = {
+    "sum": lambda count, total, low, high: total,
+    "mean": lambda count, total, low, high: total / count,
+    "count": lambda count, total, low, high: float(count),
+    "max": lambda count, total, low, high: high,
+    "min": lambda count, total, low, high: low,
+}
+
+
+class _EdgeStats:
+    """Running count, sum, min and max of one edge's amounts in one asset."""
+
+    __slots__ = ("count", "total", "low", "high")
+
+    def __init__(self, amount: float) -> None:
+        self.count = 1
+        self.total = amount
+        self.low = amount
+        self.high = amount
+
+    def add(self, amount: float) -> None:
+        self.count += 1
+        self.total += amount
+        if amount < self.low:
+            self.low = amount
+        if amount > self.high:
+            self.high = amount
 
 
 class TransactionGraph:
     """Directed graph representation of account transactions.
-    
+
     Nodes represent accounts, edges represent transactions with weights
     corresponding to transaction amounts. Supports multiple assets.
+
+    Transactions are stored column-wise: account and asset names are interned
+    to integer codes, and the source, destination, amount and asset columns
+    are appended to flat buffers that are turned into NumPy arrays on first
+    read, so aggregations run vectorized instead of over per-transaction dicts.
+    Each edge also keeps running statistics per asset, so `get_edge_weight`
+    never scans transactions.
     """
-    
+
     def __init__(self):
         """Initialize an empty transaction graph."""
-        self.nodes = set()
-        self.edges = defaultdict(lambda: defaultdict(list))
-        self._asset_edges = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
-    
+        self._account_id: Dict[str, int] = {}
+        self._accounts: List[str] = []
+        self._asset_id: Dict[str, int] = {}
+        self._asset_names: List[str] = []
+        self._asset_counts: List[int] = []
+        # (src, dst) codes -> {asset code: running statistics}
+        self._edge_stats: Dict[Tuple[int, int], Dict[int, _EdgeStats]] = {}
+        # asset code -> (src, dst) codes in the order the edge first carried the asset
+        self._asset_edges: List[List[Tuple[int, int]]] = []
+        self._src: List[int] = []
+        self._dst: List[int] = []
+        self._amount: List[float] = []
+        self._asset: List[int] = []
+        # None until a transaction's metadata is first read (most carry none)
+        self._metadata: List[Optional[Dict[str, Any]]] = []
+        # Column buffers grown by doubling; the first `_synced` rows mirror the lists
+        self._buffers: Tuple[np.ndarray, ...] = tuple(
+            np.empty(0, dtype=dtype) for dtype in _COLUMN_DTYPES
+        )
+        self._synced = 0
+        self._arrays: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = None
+        # (asset, aggregation, include_metadata) -> exported DiGraph
+        self._nx_cache: Dict[Tuple[Optional[str], str, bool], Any] = {}
+        self._edges_view: Optional[Dict[str, Dict[str, List[Dict[str, Any]]]]] = None
+
+    def _intern_account(self, account: str) -> int:
+        code = self._account_id.get(account)
+        if code is None:
+            code = self._account_id[account] = len(self._accounts)
+            self._accounts.append(account)
+        return code
+
+    @property
+    def nodes(self) -> KeysView[str]:
+        """Live, read-only set-like view of account identifiers.
+
+        Supports membership, iteration, ``len`` and set operators, but not
+        ``add``; accounts are added by `add_transaction`.
+        """
+        return self._account_id.keys()
+
     def add_transaction(
         self,
         from_account: str,
@@ -30,7 +108,7 @@ class TransactionGraph:
         metadata: Optional[Dict[str, Any]] = None
     ) -> None:
         """Add a transaction edge to the graph.
-        
+
         Args:
             from_account: Source account identifier
             to_account: Destination account identifier
@@ -38,18 +116,132 @@ class TransactionGraph:
             asset: Asset type (e.g., 'USD', 'BTC', 'ETH')
             metadata: Optional transaction metadata
         """
-        self.nodes.add(from_account)
-        self.nodes.add(to_account)
-        
-        transaction = {
-            "amount": amount,
-            "asset": asset,
-            "metadata": metadata or {}
+        asset_code = self._asset_id.get(asset)
+        if asset_code is None:
+            asset_code = self._asset_id[asset] = len(self._asset_names)
+            self._asset_names.append(asset)
+            self._asset_counts.append(0)
+            self._asset_edges.append([])
+        self._asset_counts[asset_code] += 1
+
+        src = self._intern_account(from_account)
+        dst = self._intern_account(to_account)
+        self._src.append(src)
+        self._dst.append(dst)
+        self._amount.append(amount)
+        self._asset.append(asset_code)
+        self._metadata.append(metadata or None)
+        self._arrays = None
+        if self._nx_cache:
+            self._nx_cache.clear()
+        self._edges_view = None
+
+        per_asset = self._edge_stats.setdefault((src, dst), {})
+        stats = per_asset.get(asset_code)
+        if stats is None:
+            per_asset[asset_code] = _EdgeStats(amount)
+            self._asset_edges[asset_code].append((src, dst))
+        else:
+            stats.add(amount)
+
+    def _columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(src, dst, amount, asset) array views; only new transactions are copied in."""
+        if self._arrays is None:
+            n, synced = len(self._src), self._synced
+            buffers = self._buffers
+            if n > len(buffers[0]):
+                capacity = max(n, 2 * len(buffers[0]))
+                grown = tuple(np.empty(capacity, dtype=b.dtype) for b in buffers)
+                for old, new in zip(buffers, grown):
+                    new[:synced] = old[:synced]
+                buffers = self._buffers = grown
+            columns = (self._src, self._dst, self._amount, self._asset)
+            for buffer, column in zip(buffers, columns):
+                buffer[synced:n] = column[synced:]
+            self._synced = n
+            self._arrays = tuple(buffer[:n] for buffer in buffers)
+        return self._arrays
+
+    def _pair_keys(self, src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+        return src.astype(np.int64) * len(self._accounts) + dst
+
+    def _select(
+        self,
+        from_account: Optional[str] = None,
+        to_account: Optional[str] = None,
+        asset: Optional[str] = None,
+    ) -> np.ndarray:
+        """Indices of matching transactions, in insertion order."""
+        src, dst, _, asset_codes = self._columns()
+        mask = np.ones(len(src), dtype=bool)
+        for value, lookup, column in (
+            (from_account, self._account_id, src),
+            (to_account, self._account_id, dst),
+            (asset, self._asset_id, asset_codes),
+        ):
+            if value:
+                code = lookup.get(value)
+                if code is None:
+                    return np.empty(0, dtype=np.intp)
+                mask &= column == code
+        return np.flatnonzero(mask)
+
+    def _edge_order(
+        self, idx: np.ndarray, scope: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Group selected transactions by edge in adjacency order.
+
+        Edges are ordered by when their source was first seen, then by when
+        the edge itself was first seen; transactions keep insertion order
+        within an edge. Sources are ranked by first appearance among the
+        ``scope`` rows (default: ``idx`` itself), which must contain ``idx``.
+        Returns (ordered indices, start offset of each edge).
+        """
+        src, dst, _, _ = self._columns()
+        s = src[idx]
+        pair = self._pair_keys(s, dst[idx])
+        codes, src_first, src_inv = np.unique(s, return_index=True, return_inverse=True)
+        if scope is not None:
+            # First scope row of each selected source; codes are sorted, and so
+            # are the unique sources of the matching scope rows
+            scope_src = src[scope]
+            hits = np.flatnonzero(np.isin(scope_src, codes))
+            _, first_hit = np.unique(scope_src[hits], return_index=True)
+            src_first = hits[first_hit]
+        _, pair_first, pair_inv = np.unique(pair, return_index=True, return_inverse=True)
+        order = np.lexsort((np.arange(len(idx)), pair_first[pair_inv], src_first[src_inv]))
+        grouped = pair_inv[order]
+        starts = np.flatnonzero(np.r_[True, grouped[1:] != grouped[:-1]]) if len(idx) else np.empty(0, dtype=np.intp)
+        return idx[order], starts
+
+    def _transaction(self, i: int) -> Dict[str, Any]:
+        metadata = self._metadata[i]
+        if metadata is None:
+            metadata = self._metadata[i] = {}
+        return {
+            "amount": self._amount[i],
+            "asset": self._asset_names[self._asset[i]],
+            "metadata": metadata,
         }
-        
-        self.edges[from_account][to_account].append(transaction)
-        self._asset_edges[asset][from_account][to_account].append(transaction)
-    
+
+    @property
+    def edges(self) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """Nested ``{from: {to: [transaction, ...]}}`` view of all transactions.
+
+        Nested ``defaultdict``s, so missing accounts read as empty. The view is
+        built on first access and cached until the next `add_transaction`,
+        which rebuilds it from the stored transactions: treat it as read-only
+        and use `add_transaction` to add edges.
+        """
+        view = self._edges_view
+        if view is None:
+            view = defaultdict(lambda: defaultdict(list))
+            accounts = self._accounts
+            for i in range(len(self._src)):
+                view[accounts[self._src[i]]][accounts[self._dst[i]]].append(self._transaction(i))
+            self._edges_view = view
+        return view
+
     def get_edge_weight(
         self,
         from_account: str,
@@ -58,47 +250,64 @@ class TransactionGraph:
         aggregation: str = "sum"
     ) -> float:
         """Get aggregated weight for an edge.
-        
+
         Args:
             from_account: Source account
             to_account: Destination account
             asset: Optional asset filter (None = all assets)
             aggregation: Aggregation method ('sum', 'mean', 'count', 'max', 'min')
-            
+
         Returns:
             Aggregated edge weight
         """
-        if asset:
-            transactions = self._asset_edges[asset][from_account][to_account]
-        else:
-            transactions = self.edges[from_account][to_account]
-        
-        if not transactions:
+        s = self._account_id.get(from_account)
+        d = self._account_id.get(to_account)
+        per_asset = self._edge_stats.get((s, d))
+        if per_asset is None:
             return 0.0
-        
-        amounts = [t["amount"] for t in transactions]
-        
-        if aggregation == "sum":
-            return sum(amounts)
-        elif aggregation == "mean":
-            return sum(amounts) / len(amounts)
-        elif aggregation == "count":
-            return float(len(amounts))
-        elif aggregation == "max":
-            return max(amounts)
-        elif aggregation == "min":
-            return min(amounts)
+
+        asset_code = None
+        if asset:
+            asset_code = self._asset_id.get(asset)
+            if asset_code is None:
+                return 0.0
+
+        weight = self._stats_weight(per_asset, asset_code, aggregation)
+        return 0.0 if weight is None else weight
+
+    @staticmethod
+    def _stats_weight(
+        per_asset: Dict[int, _EdgeStats],
+        asset_code: Optional[int],
+        aggregation: str,
+    ) -> Optional[float]:
+        """Aggregate one edge's running statistics; None if it has no transactions in the asset."""
+        if asset_code is not None:
+            stats = per_asset.get(asset_code)
+            if stats is None:
+                return None
+            count, total, low, high = stats.count, stats.total, stats.low, stats.high
         else:
+            # Combine the edge's per-asset statistics (one entry per asset)
+            parts = list(per_asset.values())
+            count = sum(p.count for p in parts)
+            total = sum(p.total for p in parts)
+            low = min(p.low for p in parts)
+            high = max(p.high for p in parts)
+
+        combine = _EDGE_STAT_AGGREGATIONS.get(aggregation)
+        if combine is None:
             raise ValueError(f"Unknown aggregation method: {aggregation}")
-    
+        return combine(count, total, low, high)
+
     def get_assets(self) -> List[str]:
         """Get list of all assets in the graph.
-        
+
         Returns:
             List of asset identifiers
         """
-        return list(self._asset_edges.keys())
-    
+        return list(self._asset_names)
+
     def get_transactions(
         self,
         from_account: Optional[str] = None,
@@ -106,37 +315,32 @@ class TransactionGraph:
         asset: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Get transactions matching filters.
-        
+
         Args:
             from_account: Optional source account filter
             to_account: Optional destination account filter
             asset: Optional asset filter
-            
+
         Returns:
             List of matching transactions with from/to account info
         """
-        results = []
-        
-        if asset:
-            edge_dict = self._asset_edges[asset]
-        else:
-            edge_dict = self.edges
-        
-        for src in edge_dict:
-            if from_account and src != from_account:
-                continue
-            for dst in edge_dict[src]:
-                if to_account and dst != to_account:
-                    continue
-                for txn in edge_dict[src][dst]:
-                    results.append({
-                        "from": src,
-                        "to": dst,
-                        **txn
-                    })
-        
-        return results
-    
+        # Group per edge exactly as the within-asset adjacency would list them.
+        # Only the selected rows are sorted; with just a destination filter the
+        # sources still rank by first appearance in the whole asset selection.
+        idx = self._select(from_account, to_account, asset)
+        scope = self._select(asset=asset) if to_account and not from_account else None
+        ordered, _ = self._edge_order(idx, scope)
+
+        accounts = self._accounts
+        return [
+            {
+                "from": accounts[self._src[i]],
+                "to": accounts[self._dst[i]],
+                **self._transaction(i),
+            }
+            for i in ordered.tolist()
+        ]
+
     def to_networkx(
         self,
         asset: Optional[str] = None,
@@ -144,14 +348,16 @@ class TransactionGraph:
         include_metadata: bool = False
     ):
         """Export graph to NetworkX DiGraph format.
-        
+
         Args:
             asset: Optional asset filter (None = all assets)
             aggregation: Weight aggregation method
             include_metadata: Include transaction metadata as edge attributes
-            
+
         Returns:
-            NetworkX DiGraph object
+            NetworkX DiGraph object. Exports are cached until the next
+            ``add_transaction``; each call returns a fresh copy whose edge
+            attribute dicts are its own (``transactions`` lists are shared).
         """
         try:
             import networkx as nx
@@ -160,59 +366,68 @@ class TransactionGraph:
                 "NetworkX is required for graph export. "
                 "Install it with: pip install networkx"
             )
-        
-        G = nx.DiGraph()
-        
+
+        key = (asset, aggregation, include_metadata)
+        G = self._nx_cache.get(key)
+        if G is None:
+            G = self._nx_cache[key] = self._build_networkx(nx.DiGraph(), asset, aggregation, include_metadata)
+        return G.copy()
+
+    def _build_networkx(self, G, asset: Optional[str], aggregation: str, include_metadata: bool):
         # Add nodes
         G.add_nodes_from(self.nodes)
-        
-        # Add edges with weights
+
+        asset_code = None
         if asset:
-            edge_dict = self._asset_edges[asset]
-        else:
-            edge_dict = self.edges
-        
-        for src in edge_dict:
-            for dst in edge_dict[src]:
-                weight = self.get_edge_weight(src, dst, asset, aggregation)
-                edge_attrs = {"weight": weight}
-                
-                if include_metadata:
-                    transactions = edge_dict[src][dst]
-                    edge_attrs["transaction_count"] = len(transactions)
-                    edge_attrs["transactions"] = transactions
-                
-                G.add_edge(src, dst, **edge_attrs)
-        
+            asset_code = self._asset_id.get(asset)
+            if asset_code is None:
+                return G
+
+        # Weights straight from the running edge statistics
+        names = self._accounts
+        stats = self._edge_stats
+        if not include_metadata:
+            # Edges go in first-seen order (within the asset), which NetworkX
+            # groups by source
+            pairs = self._edge_stats.keys() if asset_code is None else self._asset_edges[asset_code]
+            G.add_edges_from([
+                (names[s], names[d], {"weight": self._stats_weight(stats[s, d], asset_code, aggregation)})
+                for s, d in pairs
+            ])
+            return G
+
+        # With metadata, group the selected transactions by edge in one
+        # vectorized pass and insert in bulk
+        ordered, starts = self._edge_order(self._select(asset=asset))
+        if len(ordered) == 0:
+            return G
+
+        src, dst, _, _ = self._columns()
+        heads = ordered[starts]
+        ends = np.r_[starts[1:], len(ordered)].tolist()
+        edges = []
+        for s, d, start, end in zip(src[heads].tolist(), dst[heads].tolist(), starts.tolist(), ends):
+            transactions = [self._transaction(j) for j in ordered[start:end].tolist()]
+            edges.append((names[s], names[d], {
+                "weight": self._stats_weight(stats[s, d], asset_code, aggregation),
+                "transaction_count": len(transactions),
+                "transactions": transactions,
+            }))
+        G.add_edges_from(edges)
+
         return G
-    
+
     def summary(self) -> Dict[str, Any]:
         """Get graph summary statistics.
-        
+
         Returns:
             Dictionary with graph statistics
         """
-        total_transactions = sum(
-            len(txns)
-            for src_edges in self.edges.values()
-            for txns in src_edges.values()
-        )
-        
-        asset_stats = {}
-        for asset in self._asset_edges:
-            asset_txn_count = sum(
-                len(txns)
-                for src_edges in self._asset_edges[asset].values()
-                for txns in src_edges.values()
-            )
-            asset_stats[asset] = asset_txn_count
-        
+        # Maintained incrementally by add_transaction, so this is O(assets)
         return {
-            "node_count": len(self.nodes),
-            "edge_count": sum(
-                len(dests) for dests in self.edges.values()
-            ),
-            "transaction_count": total_transactions,
-            "asset_count": len(self._asset_edges),
-            "assets": asset_stats
+            "node_count": len(self._accounts),
+            "edge_count": len(self._edge_stats),
+            "transaction_count": len(self._src),
+            "asset_count": len(self._asset_names),
+            "assets": dict(zip(self._asset_names, self._asset_counts)),
         }
@@ -1,9 +1,10 @@
 from .service import IngestionService, IngestionResult
-from .state import IngestionState, StateStore
+from .state import IngestionState, IntervalSet, StateStore
 
 __all__ = [
     "IngestionService",
     "IngestionResult",
     "IngestionState",
+    "IntervalSet",
     "StateStore",
 ]
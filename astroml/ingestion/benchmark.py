@@ -22,7 +22,7 @@ from dataclasses import dataclass, asdict
 import json
 import os
 import time
-from typing import Callable, Optional
+from typing import Callable, Optional, TextIO
 
 try:
     import psutil  # type: ignore
@@ -32,6 +32,11 @@ except Exception:  # pragma: no cover
 from .service import IngestionService, IngestionResult
 
 
+# Compact JSONL records; one encoder shared by every run
+_ENCODER = json.JSONEncoder(separators=(',', ':'))
+_fdatasync = getattr(os, 'fdatasync', os.fsync)
+
+
 @dataclass
 class BenchmarkResult:
     start_ledger: int
@@ -47,17 +52,24 @@ class BenchmarkResult:
     timestamp: float
 
 
+_process = None
+_page_size: Optional[int] = None
+
+
 def _get_rss_mb() -> float:
+    global _process, _page_size
     if psutil is not None:
-        p = psutil.Process(os.getpid())
-        return p.memory_info().rss / (1024 * 1024)
+        # Reuse one handle per process; a forked child gets its own
+        if _process is None or _process.pid != os.getpid():
+            _process = psutil.Process(os.getpid())
+        return _process.memory_info().rss / (1024 * 1024)
     # Fallback: read from /proc/self/statm on Linux
     try:
-        with open('/proc/self/statm', 'r') as f:
-            parts = f.read().split()
-            rss_pages = int(parts[1])
-        page_size = os.sysconf('SC_PAGE_SIZE')
-        return (rss_pages * page_size) / (1024 * 1024)
+        with open('/proc/self/statm', 'rb') as f:
+            rss_pages = int(f.readline().split(None, 2)[1])
+        if _page_size is None:
+            _page_size = os.sysconf('SC_PAGE_SIZE')
+        return (rss_pages * _page_size) / (1024 * 1024)
     except Exception:
         return float('nan')
 
@@ -72,13 +84,17 @@ def run_benchmark(
     results_path: str = ".astroml_bench/ingestion_benchmark.jsonl",
     fetch_cost_us: int = 0,
     process_cost_us: int = 0,
+    results_file: Optional[TextIO] = None,
 ) -> BenchmarkResult:
     """Run ingestion benchmark and persist results.
 
     - fetch_cost_us/process_cost_us: artificial delays (microseconds) to simulate IO/CPU costs
     - results_path: JSON lines file to append benchmark results
+    - results_file: already-open text file to append to instead of results_path, so a
+                    sweep of runs can share one handle
     """
-    os.makedirs(os.path.dirname(results_path), exist_ok=True)
+    if results_file is None and os.path.dirname(results_path):
+        os.makedirs(os.path.dirname(results_path), exist_ok=True)
 
     def default_fetch(ledger_id: int) -> object:
         if fetch_cost_us > 0:
@@ -125,8 +141,22 @@ def run_benchmark(
         timestamp=time.time(),
     )
 
-    # Persist as JSONL
-    with open(results_path, 'a', encoding='utf-8') as f:
-        f.write(json.dumps(asdict(bench)) + "\n")
+    # Persist as JSONL, one write and sync per record
+    line = _ENCODER.encode(asdict(bench)) + "\n"
+    if results_file is not None:
+        _append_record(results_file, line)
+    else:
+        with open(results_path, 'a', encoding='utf-8') as f:
+            _append_record(f, line)
 
     return bench
+
+
+def _append_record(f: TextIO, line: str) -> None:
+    f.write(line)
+    f.flush()
+    try:
+        _fdatasync(f.fileno())
+    except (AttributeError, OSError, ValueError):
+        # In-memory or non-syncable streams
+        pass
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Callable, Iterable, List, Optional
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, Tuple
 
 from .state import StateStore
 
@@ -13,6 +15,38 @@ class IngestionResult:
     skipped: List[int]
 
 
+def _prefetch(
+    fetch: Callable[[int], object],
+    ledger_ids: Iterable[int],
+    workers: int,
+    window: int,
+) -> Iterator[Tuple[int, object]]:
+    """Yield (ledger_id, payload) in order while fetching up to `window` ledgers ahead.
+
+    Fetches run on a thread pool (they are I/O bound); results are handed back in
+    ledger order so the caller can process and record them sequentially.
+    """
+    ids = iter(ledger_ids)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        inflight: Deque[Tuple[int, Future]] = deque()
+        try:
+            for ledger_id in ids:
+                inflight.append((ledger_id, pool.submit(fetch, ledger_id)))
+                if len(inflight) >= window:
+                    break
+            while inflight:
+                ledger_id, future = inflight.popleft()
+                payload = future.result()
+                nxt = next(ids, None)
+                if nxt is not None:
+                    inflight.append((nxt, pool.submit(fetch, nxt)))
+                yield ledger_id, payload
+        finally:
+            # Stop queued fetches if the consumer bails out early
+            for _, future in inflight:
+                future.cancel()
+
+
 class IngestionService:
     def __init__(self, state_store: Optional[StateStore] = None) -> None:
         self.state = state_store or StateStore()
@@ -23,6 +57,8 @@ class IngestionService:
         end_ledger: Optional[int] = None,
         fetch_fn: Optional[Callable[[int], object]] = None,
         process_fn: Optional[Callable[[int, object], None]] = None,
+        workers: int = 1,
+        batch_size: int = 32,
     ) -> IngestionResult:
         """Ingest ledgers incrementally and idempotently.
 
@@ -31,12 +67,16 @@ class IngestionService:
                       or nothing if no bounds are provided.
         - fetch_fn: function to fetch data for a ledger id; defaults to identity payload
         - process_fn: function to handle processing; defaults to no-op
+        - workers: number of threads fetching ledgers concurrently; 1 keeps the strictly
+                   sequential fetch -> process loop
+        - batch_size: how many ledgers may be fetched ahead of processing when workers > 1
 
         The function will skip any ledger already recorded as processed. State is updated per-ledger,
-        ensuring safe retries.
+        ensuring safe retries. Ledgers are always processed and recorded in ascending order on the
+        calling thread, so process_fn may hold non-thread-safe resources such as a DB session.
         """
         state = self.state.load()
-        processed_set = set(state.processed_ledgers)
+        processed_set = state.processed_ledgers
 
         if start_ledger is None and end_ledger is None:
             # default behavior: attempt only the next ledger after last processed
@@ -60,20 +100,24 @@ class IngestionService:
         fetch = fetch_fn or (lambda ledger_id: {"ledger": ledger_id})
         process = process_fn or (lambda ledger_id, payload: None)
 
-        attempted: List[int] = []
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+
+        attempted: List[int] = list(range(start_ledger, end_ledger + 1))
+        # One pass over the processed runs instead of a membership test per ledger
+        skipped, pending = processed_set.split_range(start_ledger, end_ledger)
         processed: List[int] = []
-        skipped: List[int] = []
 
-        for ledger_id in range(start_ledger, end_ledger + 1):
-            attempted.append(ledger_id)
-            if ledger_id in processed_set:
-                skipped.append(ledger_id)
-                continue
+        if workers > 1:
+            fetched: Iterable[Tuple[int, object]] = _prefetch(fetch, pending, workers, batch_size)
+        else:
+            fetched = ((ledger_id, fetch(ledger_id)) for ledger_id in pending)
 
-            payload = fetch(ledger_id)
+        for ledger_id, payload in fetched:
             process(ledger_id, payload)
             self.state.mark_processed(ledger_id)
-            processed_set.add(ledger_id)
             processed.append(ledger_id)
 
         return IngestionResult(attempted=attempted, processed=processed, skipped=skipped)
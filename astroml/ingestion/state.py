@@ -2,31 +2,213 @@ from __future__ import annotations
 
 import json
 import os
+import struct
+from bisect import bisect_right
+from collections.abc import MutableSet, Set as AbstractSet
 from dataclasses import dataclass
-from typing import Optional, Set
+from numbers import Integral
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 
 DEFAULT_STATE_DIR = os.path.join(os.getcwd(), ".astroml_state")
 DEFAULT_STATE_FILE = os.path.join(DEFAULT_STATE_DIR, "ingestion_state.json")
 
+# Write-ahead log records are little-endian signed 64-bit ledger ids
+_WAL_RECORD = struct.Struct("<q")
+# Fold the log into the JSON snapshot once it outgrows this many records, or
+# 10% of the snapshot, whichever is larger
+_COMPACT_MIN_RECORDS = 1024
+
+
+class IntervalSet(MutableSet):
+    """Set of integers stored as sorted, disjoint, inclusive ``[start, end]`` runs.
+
+    Ledgers are ingested in ranges, so a few runs cover millions of ids. Membership
+    is a bisect over the run starts; iteration, ``len`` and equality (including
+    against a plain ``set``) behave like the equivalent set of ints. As a
+    ``MutableSet`` it also supports ``discard``/``remove``, the set operators and
+    comparisons, plus ``issubset``/``issuperset``.
+    """
+
+    __slots__ = ("_starts", "_ends")
+
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self.update(values)
+
+    @classmethod
+    def from_intervals(cls, intervals: Iterable[Iterable[int]]) -> "IntervalSet":
+        out = cls()
+        out._merge(sorted((int(a), int(b)) for a, b in intervals))
+        return out
+
+    @property
+    def intervals(self) -> List[Tuple[int, int]]:
+        return list(zip(self._starts, self._ends))
+
+    def __contains__(self, value: object) -> bool:
+        if type(value) is not int:
+            # Like a set of ints: equal numbers match, anything else is absent
+            if isinstance(value, Integral):
+                value = int(value)
+            elif isinstance(value, float) and value.is_integer():
+                value = int(value)
+            else:
+                return False
+        i = bisect_right(self._starts, value) - 1
+        return i >= 0 and value <= self._ends[i]
+
+    def split_range(self, start: int, end: int) -> Tuple[List[int], List[int]]:
+        """Split ``start..end`` (inclusive) into (members, non-members), both ascending."""
+        inside: List[int] = []
+        outside: List[int] = []
+        cursor = start
+        i = max(bisect_right(self._starts, start) - 1, 0)
+        for run_start, run_end in zip(self._starts[i:], self._ends[i:]):
+            if run_start > end:
+                break
+            if run_end < cursor:
+                continue
+            lo = max(run_start, cursor)
+            hi = min(run_end, end)
+            outside.extend(range(cursor, lo))
+            inside.extend(range(lo, hi + 1))
+            cursor = hi + 1
+        outside.extend(range(cursor, end + 1))
+        return inside, outside
+
+    def add(self, value: int) -> None:
+        starts, ends = self._starts, self._ends
+        i = bisect_right(starts, value) - 1
+        if i >= 0 and value <= ends[i] + 1:
+            if value <= ends[i]:
+                return
+            ends[i] = value
+            # Close the gap to the next run
+            if i + 1 < len(starts) and starts[i + 1] == value + 1:
+                ends[i] = ends.pop(i + 1)
+                starts.pop(i + 1)
+        elif i + 1 < len(starts) and starts[i + 1] == value + 1:
+            starts[i + 1] = value
+        else:
+            starts.insert(i + 1, value)
+            ends.insert(i + 1, value)
+
+    def discard(self, value: int) -> None:
+        if value not in self:
+            return
+        value = int(value)
+        starts, ends = self._starts, self._ends
+        i = bisect_right(starts, value) - 1
+        start, end = starts[i], ends[i]
+        if start == end:
+            del starts[i], ends[i]
+        elif value == start:
+            starts[i] = value + 1
+        elif value == end:
+            ends[i] = value - 1
+        else:
+            # Split the run around the removed value
+            ends[i] = value - 1
+            starts.insert(i + 1, value + 1)
+            ends.insert(i + 1, end)
+
+    def issubset(self, other: Iterable[int]) -> bool:
+        return self <= (other if isinstance(other, AbstractSet) else set(other))
+
+    def issuperset(self, other: Iterable[int]) -> bool:
+        return all(value in self for value in other)
+
+    def __ior__(self, other: Iterable[int]) -> "IntervalSet":
+        self.update(other)
+        return self
+
+    def update(self, values: Iterable[int]) -> None:
+        runs: List[Tuple[int, int]] = []
+        for value in sorted(set(values)):
+            if runs and value == runs[-1][1] + 1:
+                runs[-1] = (runs[-1][0], value)
+            else:
+                runs.append((value, value))
+        if runs:
+            self._merge(runs)
+
+    def _merge(self, runs: List[Tuple[int, int]]) -> None:
+        """Merge sorted runs into the stored runs, coalescing overlaps and neighbours."""
+        merged: List[List[int]] = []
+        existing = iter(zip(self._starts, self._ends))
+        incoming = iter(runs)
+        a = next(existing, None)
+        b = next(incoming, None)
+        while a is not None or b is not None:
+            if b is None or (a is not None and a[0] <= b[0]):
+                start, end = a
+                a = next(existing, None)
+            else:
+                start, end = b
+                b = next(incoming, None)
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        self._starts = [start for start, _ in merged]
+        self._ends = [end for _, end in merged]
+
+    def copy(self) -> "IntervalSet":
+        out = IntervalSet()
+        out._starts = list(self._starts)
+        out._ends = list(self._ends)
+        return out
+
+    def __iter__(self) -> Iterator[int]:
+        for start, end in zip(self._starts, self._ends):
+            yield from range(start, end + 1)
+
+    def __len__(self) -> int:
+        return sum(self._ends) - sum(self._starts) + len(self._starts)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, IntervalSet):
+            return self._starts == other._starts and self._ends == other._ends
+        if isinstance(other, (set, frozenset)):
+            return len(self) == len(other) and all(value in self for value in other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({self.intervals!r})"
+
 
 @dataclass
 class IngestionState:
+    """Resume point and processed ledger ids.
+
+    ``processed_ledgers`` is an `IntervalSet`: a ``MutableSet`` of ints rather
+    than a built-in ``set``, so set-only methods such as ``union`` are absent.
+    """
+
     last_processed_ledger: Optional[int]
-    processed_ledgers: Set[int]
+    processed_ledgers: IntervalSet
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.processed_ledgers, IntervalSet):
+            self.processed_ledgers = IntervalSet(self.processed_ledgers)
 
     def to_dict(self) -> dict:
         return {
             "last_processed_ledger": self.last_processed_ledger,
-            # store as sorted list for readability
-            "processed_ledgers": sorted(self.processed_ledgers),
+            # contiguous [start, end] runs keep the snapshot small for long ranges
+            "processed_ranges": [list(run) for run in self.processed_ledgers.intervals],
         }
 
     @staticmethod
     def from_dict(data: dict) -> "IngestionState":
+        processed = IntervalSet.from_intervals(data.get("processed_ranges", []))
+        # Snapshots written before processed_ranges list every ledger id
+        processed.update(data.get("processed_ledgers", []))
         return IngestionState(
             last_processed_ledger=data.get("last_processed_ledger"),
-            processed_ledgers=set(data.get("processed_ledgers", [])),
+            processed_ledgers=processed,
         )
 
 
@@ -36,31 +218,99 @@ class StateStore:
     Properties:
       - Idempotency: we retain a set of processed ledger ids and check before processing
       - Incremental: we track last_processed_ledger to resume ranges efficiently
+
+    The JSON file at ``path`` is a snapshot. ``mark_processed`` appends the ledger id
+    to a binary write-ahead log next to it (``<path>.wal``) instead of rewriting the
+    snapshot, and the log is folded back into the snapshot once it grows past a
+    fraction of it. ``load`` merges both, so a truncated last record or a crash
+    between snapshot and log truncation loses nothing already recorded.
     """
 
     def __init__(self, path: str = DEFAULT_STATE_FILE) -> None:
         self.path = path
+        self.wal_path = f"{path}.wal"
         os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._state: Optional[IngestionState] = None
+        self._snapshot_size = 0
+        self._wal_records = 0
 
-    def load(self) -> IngestionState:
+    def _load_snapshot(self) -> IngestionState:
         if not os.path.exists(self.path):
-            return IngestionState(last_processed_ledger=None, processed_ledgers=set())
+            return IngestionState(last_processed_ledger=None, processed_ledgers=IntervalSet())
         with open(self.path, "r", encoding="utf-8") as f:
             data = json.load(f)
         return IngestionState.from_dict(data)
 
+    def _load_wal(self) -> List[int]:
+        try:
+            with open(self.wal_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        # Ignore a partially written trailing record
+        usable = len(data) - len(data) % _WAL_RECORD.size
+        return [ledger_id for (ledger_id,) in _WAL_RECORD.iter_unpack(data[:usable])]
+
+    def load(self) -> IngestionState:
+        state = self._load_snapshot()
+        self._snapshot_size = len(state.processed_ledgers.intervals)
+        logged = self._load_wal()
+        self._wal_records = len(logged)
+        if logged:
+            state.processed_ledgers.update(logged)
+            newest = max(logged)
+            if state.last_processed_ledger is None or newest > state.last_processed_ledger:
+                state.last_processed_ledger = newest
+        self._state = state
+        return IngestionState(state.last_processed_ledger, state.processed_ledgers.copy())
+
     def save(self, state: IngestionState) -> None:
         tmp_path = f"{self.path}.tmp"
         with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(state.to_dict(), f, indent=2)
         os.replace(tmp_path, self.path)
+        # The snapshot now covers everything logged so far
+        if os.path.exists(self.wal_path):
+            os.remove(self.wal_path)
+        self._state = IngestionState(state.last_processed_ledger, state.processed_ledgers.copy())
+        self._snapshot_size = len(state.processed_ledgers.intervals)
+        self._wal_records = 0
 
     def mark_processed(self, ledger_id: int) -> IngestionState:
-        state = self.load()
-        state.processed_ledgers.add(ledger_id)
-        if state.last_processed_ledger is None:
-            state.last_processed_ledger = ledger_id
-        else:
-            state.last_processed_ledger = max(state.last_processed_ledger, ledger_id)
-        self.save(state)
-        return state
+        return self.mark_processed_many([ledger_id])
+
+    def mark_processed_many(self, ledger_ids: Iterable[int]) -> IngestionState:
+        """Record several ledgers with a single log append and return a copy of the state."""
+        if self._state is None:
+            self.load()
+        state = self._state
+        new = [ledger_id for ledger_id in ledger_ids if ledger_id not in state.processed_ledgers]
+        if new:
+            with open(self.wal_path, "ab") as f:
+                # Drop a torn trailing record so new records stay aligned
+                torn = f.tell() % _WAL_RECORD.size
+                if torn:
+                    f.truncate(f.tell() - torn)
+                f.write(b"".join(_WAL_RECORD.pack(ledger_id) for ledger_id in new))
+            self._wal_records += len(new)
+            for ledger_id in new:
+                state.processed_ledgers.add(ledger_id)
+            newest = max(new)
+            if state.last_processed_ledger is None or newest > state.last_processed_ledger:
+                state.last_processed_ledger = newest
+            if self._wal_records > max(_COMPACT_MIN_RECORDS, self._snapshot_size // 10):
+                self._compact()
+        state = self._state
+        return IngestionState(state.last_processed_ledger, state.processed_ledgers.copy())
+
+    def _compact(self) -> None:
+        """Fold the log into the snapshot, keeping ledgers other writers logged since our load."""
+        cached = self._state
+        merged = self.load()
+        merged.processed_ledgers.update(cached.processed_ledgers)
+        if cached.last_processed_ledger is not None and (
+            merged.last_processed_ledger is None
+            or cached.last_processed_ledger > merged.last_processed_ledger
+        ):
+            merged.last_processed_ledger = cached.last_processed_ledger
+        self.save(merged)
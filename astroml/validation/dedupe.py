@@ -9,13 +9,17 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Set
 
-from .hashing import compute_transaction_hash
+from .hashing import transaction_digester
 
 logger = logging.getLogger(__name__)
 
 
+def _utc_timestamp() -> str:
+    return datetime.utcnow().isoformat() + "Z"
+
+
 class ConflictType:
     """Constants for conflict types."""
 
@@ -23,13 +27,13 @@ class ConflictType:
     CORRUPTED = "CORRUPTED"
 
 
-@dataclass
+@dataclass(slots=True)
 class ConflictRecord:
     """Structured record of a deduplication conflict.
 
     Attributes:
         transaction_id: ID of the conflicting transaction.
-        hash: Hash of the transaction.
+        hash: Hash of the transaction (None for malformed transactions).
         conflict_type: Type of conflict (DUPLICATE or CORRUPTED).
         timestamp: When the conflict was detected.
         source: Optional source identifier for the transaction.
@@ -37,7 +41,7 @@ class ConflictRecord:
     """
 
     transaction_id: Optional[str]
-    hash: str
+    hash: Optional[str]
     conflict_type: str
     timestamp: str
     source: Optional[str] = None
@@ -45,7 +49,7 @@ class ConflictRecord:
 
     def __post_init__(self) -> None:
         if not self.timestamp:
-            self.timestamp = datetime.utcnow().isoformat() + "Z"
+            self.timestamp = _utc_timestamp()
 
 
 @dataclass
@@ -70,6 +74,8 @@ class Deduplicator:
 
     Maintains an in-memory set of seen transaction hashes and provides
     methods to detect and filter duplicates from transaction batches.
+    Hashes are held as raw 32-byte digests and hex-encoded only when they
+    leave the deduplicator (seen_hashes, results and conflict records).
     """
 
     def __init__(
@@ -83,15 +89,29 @@ class Deduplicator:
             hash_fields: Set of fields to use for hash computation.
             track_conflicts: Whether to track conflict records.
         """
-        self.hash_fields = hash_fields
-        self._seen_hashes: Set[str] = set()
+        self.hash_fields = hash_fields  # also builds the digest function
+        self._seen_hashes: Set[bytes] = set()
         self._track_conflicts = track_conflicts
         self._conflicts: List[ConflictRecord] = []
 
+    @property
+    def hash_fields(self) -> Optional[FrozenSet[str]]:
+        """Fields used for hash computation (None means DEFAULT_HASH_FIELDS).
+
+        Frozen, because the digest function is built from it: assign a
+        new set to change the fields.
+        """
+        return self._hash_fields
+
+    @hash_fields.setter
+    def hash_fields(self, value: Optional[Set[str]]) -> None:
+        self._hash_fields = None if value is None else frozenset(value)
+        self._hash = transaction_digester(self._hash_fields)
+
     @property
     def seen_hashes(self) -> Set[str]:
-        """Return a copy of the seen hashes set."""
-        return self._seen_hashes.copy()
+        """Return a copy of the seen hashes set (hex digests)."""
+        return {digest.hex() for digest in self._seen_hashes}
 
     @property
     def conflicts(self) -> List[ConflictRecord]:
@@ -109,6 +129,7 @@ class Deduplicator:
         hash_value: str,
         conflict_type: str,
         source: Optional[str] = None,
+        timestamp: Optional[str] = None,
     ) -> None:
         """Log a conflict with structured information.
 
@@ -117,6 +138,8 @@ class Deduplicator:
             hash_value: Hash of the transaction.
             conflict_type: Type of conflict (DUPLICATE or CORRUPTED).
             source: Optional source identifier.
+            timestamp: Detection time; defaults to now. Batch callers pass one
+                shared value.
         """
         transaction_id = transaction.get("id")
         message = f"Transaction {conflict_type.lower()} detected"
@@ -125,7 +148,7 @@ class Deduplicator:
             transaction_id=transaction_id,
             hash=hash_value,
             conflict_type=conflict_type,
-            timestamp=datetime.utcnow().isoformat() + "Z",
+            timestamp=timestamp or _utc_timestamp(),
             source=source,
             message=message,
         )
@@ -156,13 +179,13 @@ class Deduplicator:
             True if the transaction was added (not a duplicate).
             False if it was already seen (duplicate).
         """
-        hash_value = compute_transaction_hash(transaction, fields=self.hash_fields)
+        digest = self._hash(transaction)
 
-        if hash_value in self._seen_hashes:
-            self._log_conflict(transaction, hash_value, ConflictType.DUPLICATE, source)
+        if digest in self._seen_hashes:
+            self._log_conflict(transaction, digest.hex(), ConflictType.DUPLICATE, source)
             return False
 
-        self._seen_hashes.add(hash_value)
+        self._seen_hashes.add(digest)
         return True
 
     def check(self, transaction: Dict[str, Any]) -> bool:
@@ -174,8 +197,7 @@ class Deduplicator:
         Returns:
             True if the transaction is a duplicate.
         """
-        hash_value = compute_transaction_hash(transaction, fields=self.hash_fields)
-        return hash_value in self._seen_hashes
+        return self._hash(transaction) in self._seen_hashes
 
     def process(
         self,
@@ -192,23 +214,33 @@ class Deduplicator:
             DeduplicationResult with unique/duplicate splits and hashes.
         """
         result = DeduplicationResult()
-
-        for transaction in transactions:
-            hash_value = compute_transaction_hash(
-                transaction, fields=self.hash_fields
-            )
-
-            if hash_value in self._seen_hashes:
-                result.duplicates.append(transaction)
-                if self._track_conflicts:
-                    self._log_conflict(
-                        transaction, hash_value, ConflictType.DUPLICATE, source
-                    )
+        digest_of = self._hash
+        digests = [digest_of(transaction) for transaction in transactions]
+
+        # Tight split loop; duplicates within the batch are caught because
+        # each new hash joins the seen set before the next lookup.
+        seen = self._seen_hashes
+        mark_seen = seen.add
+        keep_unique = result.unique.append
+        keep_duplicate = result.duplicates.append
+        duplicate_digests = []
+        for transaction, digest in zip(transactions, digests):
+            if digest in seen:
+                keep_duplicate(transaction)
+                duplicate_digests.append(digest)
             else:
-                self._seen_hashes.add(hash_value)
-                result.unique.append(transaction)
-
-            result.hashes.add(hash_value)
+                mark_seen(digest)
+                keep_unique(transaction)
+
+        # Hex-encode each distinct digest once, at the API boundary
+        result.hashes = {digest.hex() for digest in set(digests)}
+
+        if self._track_conflicts and duplicate_digests:
+            detected_at = _utc_timestamp()
+            for transaction, digest in zip(result.duplicates, duplicate_digests):
+                self._log_conflict(
+                    transaction, digest.hex(), ConflictType.DUPLICATE, source, detected_at
+                )
 
         return result
 
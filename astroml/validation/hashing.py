@@ -6,16 +6,108 @@ to enable deduplication and integrity verification.
 """
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import logging
-from typing import Any, Dict, Optional, Set
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable, Dict, FrozenSet, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
 # Default fields to include in transaction hash computation
 DEFAULT_HASH_FIELDS: Set[str] = {"id", "payload", "timestamp"}
 
+# Shared encoder producing exactly json.dumps(..., sort_keys=True, default=str)
+# output; json.dumps builds a fresh JSONEncoder on every call with these options.
+_ENCODER = json.JSONEncoder(sort_keys=True, default=str)
+
+
+@functools.lru_cache(maxsize=32)
+def _sorted_fields(fields: FrozenSet[str]) -> Tuple[str, ...]:
+    """Canonical (sorted) order of a hash field set, computed once per set."""
+    return tuple(sorted(fields))
+
+
+@functools.lru_cache(maxsize=32)
+def _digest_function(ordered_fields: Tuple[str, ...]) -> Callable[[Dict[str, Any]], bytes]:
+    """Digest function specialized to one canonical field order.
+
+    Writes the same bytes as ``_ENCODER.encode`` of the filtered dict. Each key
+    prefix is encoded once, and plain str/int values skip the general encoder.
+    The encoder is still used for any other value type.
+    """
+    prefixes = tuple((field, encode_basestring_ascii(field) + ": ") for field in ordered_fields)
+    encode = _ENCODER.encode
+    sha256 = hashlib.sha256
+
+    def digest(transaction: Dict[str, Any]) -> bytes:
+        parts = []
+        for field, prefix in prefixes:
+            if field in transaction:
+                value = transaction[field]
+                kind = type(value)
+                if kind is str:
+                    parts.append(prefix + encode_basestring_ascii(value))
+                elif kind is int:
+                    parts.append(prefix + int.__repr__(value))
+                else:
+                    parts.append(prefix + encode(value))
+        return sha256(("{" + ", ".join(parts) + "}").encode("utf-8")).digest()
+
+    return digest
+
+
+def _raw_digest(transaction: Dict[str, Any], ordered_fields: Tuple[str, ...]) -> bytes:
+    return _digest_function(ordered_fields)(transaction)
+
+
+def _digest(transaction: Dict[str, Any], ordered_fields: Tuple[str, ...]) -> str:
+    return _raw_digest(transaction, ordered_fields).hex()
+
+
+def transaction_digester(
+    fields: Optional[Set[str]] = None,
+) -> Callable[[Dict[str, Any]], bytes]:
+    """Return a function computing raw transaction digests for one field set.
+
+    Equivalent to ``lambda tx: compute_transaction_digest(tx, fields)``, with
+    the canonical field order and encoders resolved once; use it to hash many
+    transactions with the same fields.
+
+    Args:
+        fields: Set of field names to include in hash computation.
+                Defaults to DEFAULT_HASH_FIELDS.
+
+    Returns:
+        Function mapping a transaction dictionary to its SHA-256 digest bytes.
+    """
+    if fields is None:
+        fields = DEFAULT_HASH_FIELDS
+    return _digest_function(_sorted_fields(frozenset(fields)))
+
+
+def compute_transaction_digest(
+    transaction: Dict[str, Any],
+    fields: Optional[Set[str]] = None,
+) -> bytes:
+    """Compute the raw 32-byte SHA-256 digest of a transaction.
+
+    Same hash as `compute_transaction_hash`, without the hex encoding; half
+    the size and cheaper to compare when kept in large in-memory sets.
+
+    Args:
+        transaction: Transaction dictionary to hash.
+        fields: Set of field names to include in hash computation.
+                Defaults to DEFAULT_HASH_FIELDS.
+
+    Returns:
+        SHA-256 digest bytes; ``.hex()`` gives the `compute_transaction_hash` value.
+    """
+    if fields is None:
+        fields = DEFAULT_HASH_FIELDS
+    return _raw_digest(transaction, _sorted_fields(frozenset(fields)))
+
 
 def compute_transaction_hash(
     transaction: Dict[str, Any],
@@ -39,15 +131,8 @@ def compute_transaction_hash(
     if fields is None:
         fields = DEFAULT_HASH_FIELDS
 
-    # Filter to only include requested fields that exist in transaction
-    hash_data: Dict[str, Any] = {}
-    for field in fields:
-        if field in transaction:
-            hash_data[field] = transaction[field]
-
-    # Sort keys for deterministic serialization
-    serialized = json.dumps(hash_data, sort_keys=True, default=str)
-    hash_value = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+    # Only requested fields present in the transaction, in canonical order
+    hash_value = _digest(transaction, _sorted_fields(frozenset(fields)))
 
     # If there's a stored hash, verify it matches
     if stored_hash is not None and stored_hash != hash_value:
@@ -92,4 +177,6 @@ def hash_batch(
     Returns:
         List of SHA-256 hex digests in the same order as input.
     """
-    return [compute_transaction_hash(tx, fields=fields) for tx in transactions]
+    ordered = _sorted_fields(frozenset(DEFAULT_HASH_FIELDS if fields is None else fields))
+    digest = _digest_function(ordered)
+    return [digest(tx).hex() for tx in transactions]
@@ -7,17 +7,23 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
 
 from .dedupe import ConflictRecord, ConflictType, DeduplicationResult, Deduplicator
-from .hashing import compute_transaction_hash
+from .hashing import transaction_digester
 from .validator import (
     CorruptionType,
     ValidationError,
     ValidationResult,
     TransactionValidator,
+    _utc_timestamp,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,6 +58,44 @@ class IntegrityResult:
         return len(self.duplicates) > 0
 
 
+@dataclass
+class IntegrityIndices:
+    """Positional result of integrity validation.
+
+    Same categories as `IntegrityResult`, given as int64 positions into the
+    processed batch rather than lists of transactions.
+
+    Attributes:
+        valid: Positions of valid, unique transactions.
+        duplicates: Positions of duplicate transactions.
+        corrupted: Positions of corrupted transactions.
+        all_hashes: Set of all hashes processed.
+        validation_errors: List of all validation errors.
+        conflicts: List of all conflict records.
+    """
+
+    valid: Optional[np.ndarray] = None
+    duplicates: Optional[np.ndarray] = None
+    corrupted: Optional[np.ndarray] = None
+    all_hashes: Set[str] = field(default_factory=set)
+    validation_errors: List[ValidationError] = field(default_factory=list)
+    conflicts: List[ConflictRecord] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        """Check if all transactions passed integrity checks."""
+        return len(self.corrupted) == 0
+
+    @property
+    def has_duplicates(self) -> bool:
+        """Check if any duplicates were detected."""
+        return len(self.duplicates) > 0
+
+
+# Per-transaction status codes used while classifying a batch
+_VALID, _DUPLICATE, _CORRUPTED = 0, 1, 2
+
+
 class IntegrityValidator:
     """Combined deduplication and validation pipeline.
 
@@ -65,6 +109,7 @@ class IntegrityValidator:
         field_types: Optional[Dict[str, type]] = None,
         hash_fields: Optional[Set[str]] = None,
         strict: bool = False,
+        workers: int = 1,
     ) -> None:
         """Initialize the integrity validator.
 
@@ -73,7 +118,12 @@ class IntegrityValidator:
             field_types: Dict mapping field names to expected types.
             hash_fields: Set of fields to use for hash computation.
             strict: If True, raise on first corruption. Defaults to False.
+            workers: Number of processes hashing and validating a batch (see
+                `TransactionValidator.validate_batch`); duplicate detection
+                stays on the calling process. Defaults to 1.
         """
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
         self._deduplicator = Deduplicator(hash_fields=hash_fields)
         self._validator = TransactionValidator(
             required_fields=required_fields,
@@ -82,6 +132,7 @@ class IntegrityValidator:
         )
         self._strict = strict
         self._hash_fields = hash_fields
+        self._workers = workers
 
     def reset(self) -> None:
         """Reset the deduplicator state."""
@@ -141,6 +192,90 @@ class IntegrityValidator:
         """
         return self._deduplicator.add(transaction, source=source)
 
+    def _classify(
+        self,
+        transactions: Sequence[Dict[str, Any]],
+        source: Optional[str],
+        result: Union[IntegrityResult, IntegrityIndices],
+    ) -> bytearray:
+        """Run the integrity checks, returning one status code per transaction.
+
+        Codes are ``_VALID``, ``_DUPLICATE`` or ``_CORRUPTED``. Hashes,
+        validation errors and corruption conflicts are recorded on *result*.
+        """
+        status = bytearray(len(transactions))
+        seen = self._deduplicator._seen_hashes
+        detected_at = _utc_timestamp()
+
+        checked = zip(transactions, self._checked(transactions, detected_at))
+        for i, (transaction, (digest, validation)) in enumerate(checked):
+            hash_value = validation.hash
+
+            # First, the corruption check
+            if not validation.is_valid:
+                # Strict mode raises before recording anything for the row
+                if self._strict:
+                    raise IntegrityError(
+                        f"Corrupted transaction detected: {validation.errors[0].message}"
+                    )
+
+                status[i] = _CORRUPTED
+                result.validation_errors.extend(validation.errors)
+
+                # Log corruption conflict
+                conflict = ConflictRecord(
+                    transaction_id=validation.transaction_id,
+                    hash=hash_value,
+                    conflict_type=ConflictType.CORRUPTED,
+                    timestamp=validation.errors[0].timestamp if validation.errors else "",
+                    source=source,
+                    message=f"Corruption detected: {validation.errors[0].message}",
+                )
+                result.conflicts.append(conflict)
+                continue
+
+            # Check for duplicates against the deduplicator's raw digests
+            if digest in seen:
+                status[i] = _DUPLICATE
+                self._deduplicator._log_conflict(
+                    transaction, hash_value, ConflictType.DUPLICATE, source, detected_at
+                )
+            else:
+                seen.add(digest)
+
+            result.all_hashes.add(hash_value)
+
+        return status
+
+    def _checked(
+        self,
+        transactions: Sequence[Dict[str, Any]],
+        detected_at: str,
+    ) -> Iterator[Tuple[Optional[bytes], ValidationResult]]:
+        """Digest and validation result per transaction, in input order.
+
+        Transactions that are not dicts have no digest and fail validation.
+        """
+        if self._workers > 1 and len(transactions) > 1:
+            validations = self._validator._validate_in_processes(
+                transactions, None, detected_at, self._workers
+            )
+            for validation in validations:
+                digest = None if validation.hash is None else bytes.fromhex(validation.hash)
+                yield digest, validation
+            return
+
+        # One digest per transaction, shared by validation, conflict records
+        # and the duplicate check
+        digest_of = transaction_digester(self._deduplicator.hash_fields)
+        validate = self._validator._validate
+        for transaction in transactions:
+            if not isinstance(transaction, dict):
+                yield None, validate(transaction, None, None, detected_at)
+                continue
+            digest = digest_of(transaction)
+            yield digest, validate(transaction, None, digest.hex(), detected_at)
+
     def process(
         self,
         transactions: List[Dict[str, Any]],
@@ -162,51 +297,42 @@ class IntegrityValidator:
             IntegrityResult with categorized transactions.
         """
         result = IntegrityResult()
+        status = self._classify(transactions, source, result)
 
-        for transaction in transactions:
-            # First, validate for corruption
-            validation = self._validator.validate(transaction)
+        buckets = (result.valid.append, result.duplicates.append, result.corrupted.append)
+        for transaction, code in zip(transactions, status):
+            buckets[code](transaction)
 
-            if not validation.is_valid:
-                result.corrupted.append(transaction)
-                result.validation_errors.extend(validation.errors)
+        return result
 
-                if self._strict:
-                    raise IntegrityError(
-                        f"Corrupted transaction detected: {validation.errors[0].message}"
-                    )
+    def process_indices(
+        self,
+        transactions: Union[Sequence[Dict[str, Any]], pd.DataFrame],
+        source: Optional[str] = None,
+    ) -> IntegrityIndices:
+        """Process a batch like `process`, returning positions instead of lists.
 
-                # Log corruption conflict
-                hash_value = compute_transaction_hash(
-                    transaction, fields=self._hash_fields
-                )
-                conflict = ConflictRecord(
-                    transaction_id=validation.transaction_id,
-                    hash=hash_value,
-                    conflict_type=ConflictType.CORRUPTED,
-                    timestamp=validation.errors[0].timestamp if validation.errors else "",
-                    source=source,
-                    message=f"Corruption detected: {validation.errors[0].message}",
-                )
-                result.conflicts.append(conflict)
-                continue
+        Suited to large batches that already live in a DataFrame: the caller
+        slices the original frame with ``df.iloc[result.valid]`` rather than
+        receiving a list of dictionaries per category.
 
-            # Check for duplicates
-            hash_value = compute_transaction_hash(
-                transaction, fields=self._hash_fields
-            )
+        Args:
+            transactions: Sequence of transaction dictionaries, or a pandas
+                DataFrame whose rows are read as records.
+            source: Optional source identifier.
 
-            if hash_value in self._deduplicator.seen_hashes:
-                result.duplicates.append(transaction)
-                self._deduplicator._log_conflict(
-                    transaction, hash_value, ConflictType.DUPLICATE, source
-                )
-            else:
-                self._deduplicator._seen_hashes.add(hash_value)
-                result.valid.append(transaction)
+        Returns:
+            IntegrityIndices with int64 position arrays per category.
+        """
+        if hasattr(transactions, "to_dict"):
+            transactions = transactions.to_dict("records")
 
-            result.all_hashes.add(hash_value)
+        result = IntegrityIndices()
+        status = np.frombuffer(self._classify(transactions, source, result), dtype=np.uint8)
 
+        result.valid = np.flatnonzero(status == _VALID)
+        result.duplicates = np.flatnonzero(status == _DUPLICATE)
+        result.corrupted = np.flatnonzero(status == _CORRUPTED)
         return result
 
     def verify_integrity(
@@ -20,6 +20,29 @@ import pandas as pd
 
 from typing import NamedTuple
 
+try:
+    import numba  # type: ignore
+except Exception:  # pragma: no cover
+    numba = None  # Fallback to the NumPy implementation
+
+# Below this many cells the JIT dispatch overhead outweighs the early exit
+_NUMBA_MIN_SIZE = 10_000
+
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _varying_columns_kernel(X, out):
+        # Per column, stop at the first value that differs from row 0;
+        # NaN only matches NaN, as in nunique(dropna=False)
+        for j in numba.prange(X.shape[1]):
+            first = X[0, j]
+            first_nan = np.isnan(first)
+            for i in range(1, X.shape[0]):
+                x = X[i, j]
+                if np.isnan(x) != first_nan or (not first_nan and x != first):
+                    out[j] = True
+                    break
+
 
 # ---------------------------------------------------------------------------
 # Types
@@ -93,18 +116,32 @@ def temporal_train_test_split(
         return df.copy(), df.copy()
 
     if cutoff is not None:
-        train_mask = df[time_col] < cutoff
-        train_df = df.loc[train_mask].copy()
-        test_df = df.loc[~train_mask].copy()
+        times = df[time_col]
+        if _is_non_decreasing(times):
+            # Sorted: rows before the cutoff are a prefix, found by binary search
+            split_idx = int(times.searchsorted(cutoff, side="left"))
+            train_df = df.iloc[:split_idx].copy()
+            test_df = df.iloc[split_idx:].copy()
+        else:
+            train_mask = times < cutoff
+            train_df = df.loc[train_mask].copy()
+            test_df = df.loc[~train_mask].copy()
     else:
         if not (0 < train_ratio < 1):
             raise ValueError(
                 f"train_ratio must be in (0, 1), got {train_ratio}"
             )
-        sorted_df = df.sort_values(time_col).reset_index(drop=True)
-        split_idx = int(len(sorted_df) * train_ratio)
-        train_df = sorted_df.iloc[:split_idx].copy()
-        test_df = sorted_df.iloc[split_idx:].copy()
+        split_idx = int(len(df) * train_ratio)
+        if _is_non_decreasing(df[time_col]):
+            # Already in time order (the usual case): slice without sorting
+            train_df = df.iloc[:split_idx].copy()
+            test_df = df.iloc[split_idx:].copy()
+            train_df.index = pd.RangeIndex(0, split_idx)
+            test_df.index = pd.RangeIndex(split_idx, len(df))
+        else:
+            sorted_df = df.sort_values(time_col, ignore_index=True)
+            train_df = sorted_df.iloc[:split_idx].copy()
+            test_df = sorted_df.iloc[split_idx:].copy()
 
     if train_df.empty:
         warnings.warn(
@@ -193,45 +230,7 @@ def check_feature_leakage(
         List of :class:`LeakageWarning` instances.  An empty list means no
         issues were detected.
     """
-    results: list[LeakageWarning] = []
-
-    if df.empty:
-        return results
-
-    # -- Temporal sort check --------------------------------------------------
-    if time_col in df.columns and not df[time_col].is_monotonic_increasing:
-        w = LeakageWarning(
-            column=time_col,
-            warning_type="unsorted",
-            message=(
-                f"Column '{time_col}' is not sorted in ascending order; "
-                "data may not respect temporal boundaries"
-            ),
-        )
-        results.append(w)
-        warnings.warn(w.message, UserWarning, stacklevel=2)
-
-    # -- Constant column check ------------------------------------------------
-    if feature_cols is None:
-        numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-        feature_cols = [c for c in numeric_cols if c != time_col]
-
-    for col in feature_cols:
-        if col not in df.columns:
-            continue
-        if df[col].nunique(dropna=False) <= 1:
-            w = LeakageWarning(
-                column=col,
-                warning_type="constant",
-                message=(
-                    f"Column '{col}' has zero variance (constant); "
-                    "this may indicate a leakage artifact or a useless feature"
-                ),
-            )
-            results.append(w)
-            warnings.warn(w.message, UserWarning, stacklevel=2)
-
-    return results
+    return LeakageScanner(df)._feature_leakage(time_col, feature_cols, stacklevel=3)
 
 
 def check_target_leakage(
@@ -262,34 +261,150 @@ def check_target_leakage(
         List of :class:`LeakageWarning` instances.  An empty list means no
         issues were detected.
     """
-    results: list[LeakageWarning] = []
+    return LeakageScanner(df)._target_leakage(
+        target_col, feature_cols, threshold, stacklevel=3
+    )
 
-    if df.empty or target_col not in df.columns:
-        return results
 
-    if feature_cols is None:
-        numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-        feature_cols = [c for c in numeric_cols if c != target_col]
+class LeakageScanner:
+    """Run several leakage checks over one DataFrame.
 
-    target = df[target_col]
+    The numeric column list and each column's float64 values are computed
+    once, on first use, and shared by every check run through the scanner.
+    :func:`check_feature_leakage` and :func:`check_target_leakage` build a
+    fresh scanner per call; keep one scanner to run both over the same
+    frame.
+
+    The scanner caches what it reads from *df*, so it must not be reused
+    after *df* is modified.
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.df = df
+        self._numeric_columns: Optional[list[str]] = None
+        self._float_columns: dict[Any, np.ndarray] = {}
+
+    @property
+    def numeric_columns(self) -> list[str]:
+        """Numeric columns of the frame, in frame order."""
+        if self._numeric_columns is None:
+            self._numeric_columns = self.df.select_dtypes(include=[np.number]).columns.tolist()
+        return self._numeric_columns
+
+    def float_column(self, col: str) -> np.ndarray:
+        """Float64 values of *col*, nulls as NaN, cached per scanner."""
+        values = self._float_columns.get(col)
+        if values is None:
+            values = self.df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            self._float_columns[col] = values
+        return values
+
+    def float_matrix(self, cols: list[str]) -> np.ndarray:
+        """Column-major float64 matrix of *cols*, nulls as NaN.
+
+        Each column is converted once per scanner (a float64 column is not
+        copied at all) and then written into the matrix.
+        """
+        X = np.empty((len(self.df), len(cols)), dtype=np.float64, order="F")
+        for j, col in enumerate(cols):
+            X[:, j] = self.float_column(col)
+        return X
+
+    def check_feature_leakage(
+        self,
+        time_col: str,
+        feature_cols: Optional[list[str]] = None,
+    ) -> list[LeakageWarning]:
+        """Same as :func:`check_feature_leakage` on this scanner's frame."""
+        return self._feature_leakage(time_col, feature_cols, stacklevel=3)
+
+    def check_target_leakage(
+        self,
+        target_col: str,
+        feature_cols: Optional[list[str]] = None,
+        threshold: float = 0.95,
+    ) -> list[LeakageWarning]:
+        """Same as :func:`check_target_leakage` on this scanner's frame."""
+        return self._target_leakage(target_col, feature_cols, threshold, stacklevel=3)
+
+    def _feature_leakage(
+        self,
+        time_col: str,
+        feature_cols: Optional[list[str]],
+        stacklevel: int,
+    ) -> list[LeakageWarning]:
+        results: list[LeakageWarning] = []
+        df = self.df
+
+        if df.empty:
+            return results
+
+        # -- Temporal sort check ----------------------------------------------
+        if time_col in df.columns and not _is_non_decreasing(df[time_col]):
+            w = LeakageWarning(
+                column=time_col,
+                warning_type="unsorted",
+                message=(
+                    f"Column '{time_col}' is not sorted in ascending order; "
+                    "data may not respect temporal boundaries"
+                ),
+            )
+            results.append(w)
+            warnings.warn(w.message, UserWarning, stacklevel=stacklevel)
+
+        # -- Constant column check --------------------------------------------
+        if feature_cols is None:
+            feature_cols = [c for c in self.numeric_columns if c != time_col]
+
+        feature_cols = [c for c in feature_cols if c in df.columns]
+        constant = self._constant_columns(feature_cols)
+
+        for col in feature_cols:
+            if constant[col]:
+                w = LeakageWarning(
+                    column=col,
+                    warning_type="constant",
+                    message=(
+                        f"Column '{col}' has zero variance (constant); "
+                        "this may indicate a leakage artifact or a useless feature"
+                    ),
+                )
+                results.append(w)
+                warnings.warn(w.message, UserWarning, stacklevel=stacklevel)
 
-    # Skip if the target itself has zero variance.
-    if target.std() == 0:
         return results
 
-    for col in feature_cols:
-        if col not in df.columns:
-            continue
+    def _target_leakage(
+        self,
+        target_col: str,
+        feature_cols: Optional[list[str]],
+        threshold: float,
+        stacklevel: int,
+    ) -> list[LeakageWarning]:
+        results: list[LeakageWarning] = []
+        df = self.df
+
+        if df.empty or target_col not in df.columns:
+            return results
 
-        series = df[col]
+        if feature_cols is None:
+            feature_cols = [c for c in self.numeric_columns if c != target_col]
 
-        # Skip zero-variance features (correlation is undefined).
-        if series.std() == 0:
-            continue
+        # Skip if the target itself has zero variance.
+        if df[target_col].std() == 0:
+            return results
 
-        corr = target.corr(series)
+        feature_cols = [c for c in feature_cols if c in df.columns]
+        if not feature_cols:
+            return results
 
-        if abs(corr) > threshold:
+        corrs = _pairwise_pearson(
+            self.float_matrix(feature_cols), self.float_column(target_col)
+        )
+
+        # NaN (zero-variance or too few pairs) compares False and is never flagged.
+        for j in np.flatnonzero(np.abs(corrs) > threshold):
+            col, corr = feature_cols[j], corrs[j]
             w = LeakageWarning(
                 column=col,
                 warning_type="target_correlation",
@@ -299,6 +414,111 @@ def check_target_leakage(
                 ),
             )
             results.append(w)
-            warnings.warn(w.message, UserWarning, stacklevel=2)
+            warnings.warn(w.message, UserWarning, stacklevel=stacklevel)
+
+        return results
 
-    return results
+    def _constant_columns(self, cols: list[str]) -> dict[str, bool]:
+        """Whether each column holds a single value, NaN counting as a value.
+
+        Same answer as ``nunique(dropna=False) <= 1`` without building a hash
+        set.  Numeric columns whose first, middle and last values differ are
+        settled by that probe alone; the rest are scanned in full: float
+        columns together against their first row, plain integer/bool columns
+        against their first element.  Other dtypes fall back to ``nunique``.
+        """
+        constant: dict[str, bool] = {}
+        float_cols = []
+        for col in cols:
+            series = self.df[col]
+            if series.dtype.kind == "f":
+                if _probe_varies(self.float_column(col)):
+                    constant[col] = False
+                else:
+                    float_cols.append(col)
+            elif isinstance(series.dtype, np.dtype) and series.dtype.kind in "iub":
+                values = series.to_numpy()
+                constant[col] = not (
+                    _probe_varies(values) or (values != values[0]).any()
+                )
+            else:
+                constant[col] = series.nunique(dropna=False) <= 1
+
+        if float_cols:
+            X = self.float_matrix(float_cols)
+            if numba is not None and X.size > _NUMBA_MIN_SIZE:
+                varying = np.zeros(X.shape[1], dtype=np.bool_)
+                _varying_columns_kernel(X, varying)
+            else:
+                nan = np.isnan(X)
+                varying = ((X != X[0]) & ~nan).any(axis=0) | (nan != nan[0]).any(axis=0)
+            constant.update(zip(float_cols, ~varying))
+
+        return constant
+
+
+def _probe_varies(values: np.ndarray) -> bool:
+    """True if the first, middle and last values are not all equal.
+
+    NaN counts as equal to NaN.  A False answer proves nothing; the column
+    still needs a full scan.
+    """
+    first = values[0]
+    for probe in (values[len(values) // 2], values[-1]):
+        if probe != first and (probe == probe or first == first):
+            return True
+    return False
+
+
+def _is_non_decreasing(series: pd.Series) -> bool:
+    """``series.is_monotonic_increasing`` as one vectorized compare.
+
+    Numeric and datetime columns are checked with a single NumPy pass over
+    adjacent pairs; NaN/NaT compare False, so they fail the check as they
+    do in pandas.  Other dtypes use the pandas property.
+    """
+    values = series.to_numpy()
+    if values.dtype.kind not in "biufmM":
+        return series.is_monotonic_increasing
+    if values.dtype.kind in "fmM" and values.size and pd.isna(values[0]):
+        # Lone NaN has no pair to fail the compare
+        return False
+    return bool(np.all(values[1:] >= values[:-1]))
+
+
+def _pairwise_pearson(X: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Pearson correlation of every column of *X* with *y* in one pass.
+
+    Matches ``Series.corr``: rows where either side is NaN are dropped per
+    column.  Columns that are constant over their non-null values get NaN,
+    as do columns with fewer than two complete pairs.
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x_null = np.isnan(X)
+        y_null = np.isnan(y)
+        if not x_null.any() and not y_null.any():
+            # Dense fast path: min/max for constancy, one mean-centering and
+            # a single GEMV, with no masked temporaries.
+            constant = X.min(axis=0) == X.max(axis=0)
+            xc = X - X.mean(axis=0)
+            yc = y - y.mean()
+            num = xc.T @ yc
+            den = np.sqrt(np.einsum("ij,ij->j", xc, xc) * (yc @ yc))
+            count = np.full(X.shape[1], len(y))
+        else:
+            x_valid = ~x_null
+            constant = np.where(x_valid, X, np.inf).min(axis=0) == np.where(
+                x_valid, X, -np.inf
+            ).max(axis=0)
+            mask = x_valid & ~y_null[:, None]
+            count = mask.sum(axis=0)
+            xz = np.where(mask, X, 0.0)
+            yz = np.where(mask, y[:, None], 0.0)
+            xc = np.where(mask, xz - xz.sum(axis=0) / count, 0.0)
+            yc = np.where(mask, yz - yz.sum(axis=0) / count, 0.0)
+            num = np.einsum("ij,ij->j", xc, yc)
+            den = np.sqrt(np.einsum("ij,ij->j", xc, xc) * np.einsum("ij,ij->j", yc, yc))
+
+        corrs = np.clip(num / den, -1.0, 1.0)
+    corrs[constant | (count < 2) | (den == 0)] = np.nan
+    return corrs
@@ -8,11 +8,15 @@ or has hash mismatches.
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Sequence, Set, Tuple
 
-from .hashing import compute_transaction_hash, verify_transaction_hash
+from .dedupe import _utc_timestamp
+from .hashing import compute_transaction_hash, hash_batch, verify_transaction_hash
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +31,7 @@ class CorruptionType:
     MALFORMED_STRUCTURE = "MALFORMED_STRUCTURE"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationError:
     """Structured validation error information.
 
@@ -47,10 +51,10 @@ class ValidationError:
 
     def __post_init__(self) -> None:
         if not self.timestamp:
-            self.timestamp = datetime.utcnow().isoformat() + "Z"
+            self.timestamp = _utc_timestamp()
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of transaction validation.
 
@@ -58,13 +62,78 @@ class ValidationResult:
         is_valid: Whether the transaction passed validation.
         errors: List of validation errors (empty if valid).
         transaction_id: ID of the validated transaction.
-        hash: Computed hash of the transaction.
+        hash: Computed hash of the transaction (None if it is not a dict).
     """
 
     is_valid: bool
     errors: List[ValidationError]
     transaction_id: Optional[str]
-    hash: str
+    hash: Optional[str]
+
+
+def _intern(field: str) -> str:
+    return sys.intern(field) if type(field) is str else field
+
+
+def _schema_checker(
+    required_fields: Tuple[str, ...],
+    field_types: Tuple[Tuple[str, type], ...],
+) -> Callable[[Dict[str, Any], Optional[str], str], List[ValidationError]]:
+    """Required-field and type checks specialized to one fixed schema.
+
+    Field names are interned and error messages are built once (type
+    messages once per field and offending type), and each field costs a
+    single ``dict.get``; missing and null values are treated alike.  All
+    errors share one timestamp: the one passed in, else the time of the
+    first error.
+    """
+    required = tuple(
+        (_intern(field), f"Required field '{field}' is missing or null")
+        for field in required_fields
+    )
+    typed = tuple((_intern(field), expected_type) for field, expected_type in field_types)
+    type_messages: Dict[Tuple[str, type], str] = {}
+
+    def check(
+        transaction: Dict[str, Any], transaction_id: Optional[str], timestamp: str
+    ) -> List[ValidationError]:
+        errors: List[ValidationError] = []
+        get = transaction.get
+        for field, message in required:
+            if get(field) is None:
+                timestamp = timestamp or _utc_timestamp()
+                errors.append(
+                    ValidationError(
+                        transaction_id=transaction_id,
+                        error_type=CorruptionType.MISSING_FIELD,
+                        message=message,
+                        field=field,
+                        timestamp=timestamp,
+                    )
+                )
+        for field, expected_type in typed:
+            value = get(field)
+            if value is not None and not isinstance(value, expected_type):
+                timestamp = timestamp or _utc_timestamp()
+                key = (field, type(value))
+                message = type_messages.get(key)
+                if message is None:
+                    message = type_messages[key] = (
+                        f"Field '{field}' has type {key[1].__name__}, "
+                        f"expected {expected_type.__name__}"
+                    )
+                errors.append(
+                    ValidationError(
+                        transaction_id=transaction_id,
+                        error_type=CorruptionType.INVALID_TYPE,
+                        message=message,
+                        field=field,
+                        timestamp=timestamp,
+                    )
+                )
+        return errors
+
+    return check
 
 
 class TransactionValidator:
@@ -83,10 +152,42 @@ class TransactionValidator:
             field_types: Dict mapping field names to expected types.
             hash_fields: Set of fields to use for hash computation.
         """
-        self.required_fields = required_fields or {"id"}
-        self.field_types = field_types or {}
+        self._required_fields: FrozenSet[str] = frozenset(required_fields or {"id"})
+        self.field_types = field_types or {}  # also builds the schema checker
         self.hash_fields = hash_fields
 
+    @property
+    def required_fields(self) -> FrozenSet[str]:
+        """Fields that must be present and non-null.
+
+        Frozen, because the schema checker is specialized to it: assign a new
+        set to change the schema.
+        """
+        return self._required_fields
+
+    @required_fields.setter
+    def required_fields(self, value: Set[str]) -> None:
+        self._required_fields = frozenset(value)
+        self._check_schema = _schema_checker(
+            tuple(self._required_fields), tuple(self._field_types.items())
+        )
+
+    @property
+    def field_types(self) -> Mapping[str, type]:
+        """Expected type per field, checked when the field is non-null.
+
+        A read-only mapping, because the schema checker is specialized to it:
+        assign a new dict to change the schema.
+        """
+        return self._field_types
+
+    @field_types.setter
+    def field_types(self, value: Mapping[str, type]) -> None:
+        self._field_types = MappingProxyType(dict(value))
+        self._check_schema = _schema_checker(
+            tuple(self._required_fields), tuple(self._field_types.items())
+        )
+
     def validate(
         self,
         transaction: Dict[str, Any],
@@ -101,49 +202,53 @@ class TransactionValidator:
         Returns:
             ValidationResult with validation status and any errors.
         """
-        errors: List[ValidationError] = []
-        transaction_id = transaction.get("id")
+        return self._validate(transaction, stored_hash)
 
-        # Check for missing required fields
-        for field in self.required_fields:
-            if field not in transaction or transaction[field] is None:
-                errors.append(
-                    ValidationError(
-                        transaction_id=transaction_id,
-                        error_type=CorruptionType.MISSING_FIELD,
-                        message=f"Required field '{field}' is missing or null",
-                        field=field,
-                    )
-                )
-
-        # Check for invalid types
-        for field, expected_type in self.field_types.items():
-            if field in transaction and transaction[field] is not None:
-                if not isinstance(transaction[field], expected_type):
-                    errors.append(
-                        ValidationError(
-                            transaction_id=transaction_id,
-                            error_type=CorruptionType.INVALID_TYPE,
-                            message=f"Field '{field}' has type {type(transaction[field]).__name__}, "
-                            f"expected {expected_type.__name__}",
-                            field=field,
-                        )
-                    )
+    def _validate(
+        self,
+        transaction: Dict[str, Any],
+        stored_hash: Optional[str],
+        tx_hash: Optional[str] = None,
+        timestamp: Optional[str] = None,
+    ) -> ValidationResult:
+        """Validate with an optional precomputed hash (see `validate_batch`).
 
-        # Check for malformed structure
+        Errors are stamped with *timestamp*, or with one time taken at the
+        first error; batch callers pass one shared value.
+        """
+        # Malformed structure: nothing else can be checked or hashed
         if not isinstance(transaction, dict):
-            errors.append(
-                ValidationError(
-                    transaction_id=transaction_id,
-                    error_type=CorruptionType.MALFORMED_STRUCTURE,
-                    message="Transaction is not a dictionary",
-                )
+            error = ValidationError(
+                transaction_id=None,
+                error_type=CorruptionType.MALFORMED_STRUCTURE,
+                message="Transaction is not a dictionary",
+                timestamp=timestamp or _utc_timestamp(),
+            )
+            logger.warning(
+                "Transaction validation failed: id=%s type=%s message=%s field=%s",
+                None,
+                error.error_type,
+                error.message,
+                error.field,
             )
+            return ValidationResult(
+                is_valid=False, errors=[error], transaction_id=None, hash=None
+            )
+
+        transaction_id = transaction.get("id")
 
-        # Compute hash for the transaction
-        tx_hash = compute_transaction_hash(
-            transaction, fields=self.hash_fields, stored_hash=stored_hash
+        # Missing required fields and invalid types
+        errors: List[ValidationError] = self._check_schema(
+            transaction, transaction_id, timestamp or ""
         )
+        detected_at = errors[0].timestamp if errors else timestamp
+
+        # Compute hash for the transaction; a mismatching precomputed hash is
+        # recomputed here so the hashing module still logs the mismatch
+        if tx_hash is None or (stored_hash is not None and stored_hash != tx_hash):
+            tx_hash = compute_transaction_hash(
+                transaction, fields=self.hash_fields, stored_hash=stored_hash
+            )
 
         # Verify hash if stored hash is provided
         if stored_hash is not None and stored_hash != tx_hash:
@@ -152,6 +257,7 @@ class TransactionValidator:
                     transaction_id=transaction_id,
                     error_type=CorruptionType.HASH_MISMATCH,
                     message=f"Hash mismatch: expected {stored_hash}, computed {tx_hash}",
+                    timestamp=detected_at or _utc_timestamp(),
                 )
             )
 
@@ -177,29 +283,94 @@ class TransactionValidator:
         self,
         transactions: List[Dict[str, Any]],
         stored_hashes: Optional[List[str]] = None,
+        workers: int = 1,
     ) -> List[ValidationResult]:
         """Validate a batch of transactions.
 
         Args:
             transactions: List of transaction dictionaries to validate.
             stored_hashes: Optional list of pre-stored hashes for verification.
+            workers: Number of processes validating contiguous chunks of the
+                batch; 1 validates on the calling thread. Transactions and
+                results are pickled between processes, so this only pays off
+                for large batches.
 
         Returns:
             List of ValidationResult in the same order as input transactions.
         """
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+
+        detected_at = _utc_timestamp()
+        if workers == 1 or len(transactions) < 2:
+            return self._validate_all(transactions, stored_hashes, detected_at)
+        return self._validate_in_processes(transactions, stored_hashes, detected_at, workers)
+
+    def _validate_in_processes(
+        self,
+        transactions: Sequence[Dict[str, Any]],
+        stored_hashes: Optional[List[str]],
+        detected_at: str,
+        workers: int,
+    ) -> List[ValidationResult]:
+        size = -(-len(transactions) // workers)
+        starts = range(0, len(transactions), size)
+        schema = (self.required_fields, dict(self.field_types), self.hash_fields)
+        # Workers come from a forkserver: forking a parent that already runs
+        # threads (numba kernels, BLAS pools) can deadlock the children
+        context = multiprocessing.get_context("forkserver")
+        with ProcessPoolExecutor(max_workers=min(workers, len(starts)), mp_context=context) as pool:
+            chunks = pool.map(
+                _validate_chunk,
+                [schema] * len(starts),
+                [transactions[i:i + size] for i in starts],
+                [None if stored_hashes is None else stored_hashes[i:i + size] for i in starts],
+                [detected_at] * len(starts),
+            )
+            return [result for chunk in chunks for result in chunk]
+
+    def _validate_all(
+        self,
+        transactions: List[Dict[str, Any]],
+        stored_hashes: Optional[List[str]],
+        detected_at: str,
+    ) -> List[ValidationResult]:
         results: List[ValidationResult] = []
+        # Canonicalize and hash the batch in one pass up front; rows that are
+        # not dicts have no hash and are reported as malformed by _validate
+        hashes = iter(hash_batch(
+            [tx for tx in transactions if isinstance(tx, dict)], fields=self.hash_fields
+        ))
 
         for i, transaction in enumerate(transactions):
+            tx_hash = next(hashes) if isinstance(transaction, dict) else None
             stored_hash = None
             if stored_hashes is not None and i < len(stored_hashes):
                 stored_hash = stored_hashes[i]
 
-            result = self.validate(transaction, stored_hash=stored_hash)
+            result = self._validate(transaction, stored_hash, tx_hash, detected_at)
             results.append(result)
 
         return results
 
 
+def _validate_chunk(
+    schema: Tuple[Set[str], Dict[str, type], Optional[Set[str]]],
+    transactions: List[Dict[str, Any]],
+    stored_hashes: Optional[List[str]],
+    detected_at: str,
+) -> List[ValidationResult]:
+    """Worker-process entry point for `TransactionValidator.validate_batch`.
+
+    The validator is rebuilt from its schema because the specialized
+    checker closure cannot be pickled.
+    """
+    required_fields, field_types, hash_fields = schema
+    validator = TransactionValidator(field_types=field_types, hash_fields=hash_fields)
+    validator.required_fields = required_fields
+    return validator._validate_all(transactions, stored_hashes, detected_at)
+
+
 def validate_transaction(
     transaction: Dict[str, Any],
     required_fields: Optional[Set[str]] = None,
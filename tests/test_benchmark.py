@@ -5,10 +5,11 @@ import json
 
 from astroml.ingestion.service import IngestionService
 from astroml.ingestion.benchmark import run_benchmark
+from astroml.ingestion.state import StateStore
 
 
 def test_benchmark_reports_and_saves(tmp_path):
-    svc = IngestionService()
+    svc = IngestionService(state_store=StateStore(path=str(tmp_path / 'state.json')))
     outpath = tmp_path / 'bench.jsonl'
 
     bench = run_benchmark(
@@ -33,3 +34,17 @@ def test_benchmark_reports_and_saves(tmp_path):
     assert rec['attempted'] == 50
     assert 'tx_per_sec' in rec
     assert 'rss_mb_start' in rec and 'rss_mb_end' in rec
+
+
+def test_benchmark_sweep_shares_results_file(tmp_path):
+    svc = IngestionService(state_store=StateStore(path=str(tmp_path / 'state.json')))
+    outpath = tmp_path / 'sweep.jsonl'
+
+    with open(outpath, 'a', encoding='utf-8') as f:
+        for end in (4, 9):
+            run_benchmark(svc, start_ledger=0, end_ledger=end, results_file=f,
+                          results_path=str(tmp_path / 'unused' / 'bench.jsonl'))
+
+    records = [json.loads(line) for line in outpath.read_text(encoding='utf-8').splitlines()]
+    assert [r['attempted'] for r in records] == [5, 10]
+    assert not (tmp_path / 'unused').exists()
@@ -82,6 +82,15 @@ class TestDeduplicator:
         assert len(dedup.conflicts) == 1
         assert dedup.conflicts[0].conflict_type == dedupe.ConflictType.DUPLICATE
 
+    def test_hash_fields_changes(self):
+        """Should refuse in-place hash field edits and honour reassignment."""
+        dedup = dedupe.Deduplicator(hash_fields={"id"})
+        with pytest.raises(AttributeError):
+            dedup.hash_fields.add("x")
+        dedup.hash_fields = {"id", "x"}
+        assert dedup.add({"id": 1, "x": 1}) is True
+        assert dedup.add({"id": 1, "x": 2}) is True
+
 
 class TestDeduplicate:
     """Tests for deduplicate convenience function."""
@@ -2,7 +2,11 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from astroml.features.frequency import _extract_daily_counts
+from astroml.features.frequency import (
+    _compute_burstiness,
+    _extract_daily_counts,
+    compute_frequency_metrics,
+)
 
 
 class TestExtractDailyCounts:
@@ -81,3 +85,59 @@ class TestExtractDailyCounts:
         result = _extract_daily_counts(timestamps)
         expected = np.array([3, 0, 2, 0, 1])
         np.testing.assert_array_equal(result, expected)
+
+    def test_timezone_aware_local_days(self):
+        """Timezone-aware timestamps are bucketed by local calendar day."""
+        timestamps = pd.Series(pd.to_datetime([
+            '2024-01-01 23:30', '2024-01-02 00:30'
+        ]).tz_localize('America/New_York'))
+        result = _extract_daily_counts(timestamps)
+        np.testing.assert_array_equal(result, np.array([1, 1]))
+
+
+class TestComputeFrequencyMetrics:
+    """Unit tests for the vectorized per-account panel."""
+
+    def test_matches_per_account_daily_counts(self):
+        """Panel metrics equal the per-account _extract_daily_counts results."""
+        rng = np.random.default_rng(0)
+        n = 200
+        df = pd.DataFrame({
+            'account': rng.choice(['a', 'b', 'c', 'd'], size=n),
+            'timestamp': pd.to_datetime('2024-01-01')
+            + pd.to_timedelta(rng.integers(0, 30 * 86400, size=n), unit='s'),
+        })
+        result = compute_frequency_metrics(df)
+
+        for account, group in df.groupby('account'):
+            counts = _extract_daily_counts(group['timestamp'])
+            mean, std = counts.mean(), counts.std()
+            assert result.loc[account, 'mean_tx_per_day'] == pytest.approx(mean)
+            assert result.loc[account, 'std_tx_per_day'] == pytest.approx(std)
+            assert result.loc[account, 'burstiness'] == pytest.approx(
+                _compute_burstiness(mean, std)
+            )
+
+    def test_numeric_timestamps(self):
+        """Unix-second timestamps are supported."""
+        df = pd.DataFrame({'account': ['a', 'a'], 'timestamp': [0, 2 * 86400]})
+        result = compute_frequency_metrics(df)
+        assert result.loc['a', 'mean_tx_per_day'] == pytest.approx(2 / 3)
+
+    def test_timezone_aware_timestamps(self):
+        """Timezone-aware timestamps are bucketed by local calendar day."""
+        df = pd.DataFrame({
+            'account': ['a', 'a'],
+            'timestamp': pd.to_datetime(['2024-01-01 23:30', '2024-01-02 00:30'])
+            .tz_localize('America/New_York'),
+        })
+        result = compute_frequency_metrics(df)
+        assert result.loc['a', 'mean_tx_per_day'] == pytest.approx(1.0)
+        assert result.loc['a', 'std_tx_per_day'] == pytest.approx(0.0)
+
+    def test_empty_dataframe(self):
+        """Empty input returns an empty panel."""
+        df = pd.DataFrame({'account': [], 'timestamp': pd.Series([], dtype='datetime64[ns]')})
+        result = compute_frequency_metrics(df)
+        assert len(result) == 0
+        assert list(result.columns) == ['mean_tx_per_day', 'std_tx_per_day', 'burstiness']
@@ -49,6 +49,11 @@ def test_gat_export_attention():
     x = torch.randn(3, 4)
 
     layer = GATConv(in_dim=4, out_dim=3, heads=2)
+    _ = layer(x, edge_index)
+    # Saving attention is opt-in
+    assert layer.export_attention() is None
+
+    layer.export_attention_enabled = True
     _ = layer(x, edge_index)  # not returning attention
 
     exported = layer.export_attention()
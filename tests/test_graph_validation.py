@@ -141,6 +141,41 @@ def test_graph_summary_statistics_with_weights():
     assert stats['weight_stats']['sum'] == 30.0
 
 
+@pytest.mark.parametrize("use_scipy", [True, False])
+def test_graph_summary_statistics_components(monkeypatch, use_scipy):
+    """Test weakly connected component counts, with and without scipy."""
+    if use_scipy and graph_validation.connected_components is None:
+        pytest.skip("scipy not installed")
+    if not use_scipy:
+        monkeypatch.setattr(graph_validation, "connected_components", None)
+    edges = pd.DataFrame({
+        "source": ["A", "C", "D", "F", "X"],
+        "target": ["B", "B", "E", "D", "X"]
+    })
+    stats = graph_validation.graph_summary_statistics(edges)
+
+    assert stats['num_components'] == 3
+    assert stats['largest_component_size'] == 3
+
+
+def test_weight_stats_skip_nulls_like_pandas():
+    edges = pd.DataFrame({
+        "source": ["A", "B", "C"],
+        "target": ["B", "C", "A"],
+        "weight": [1.0, None, -3.0]
+    })
+    view = graph_validation.GraphView(edges)
+    stats = graph_validation.graph_summary_statistics(view, weight_col="weight")
+    with pytest.warns(graph_validation.GraphValidationWarning):
+        checks = graph_validation.check_edge_consistency(view, weight_col="weight")
+
+    weights = edges["weight"]
+    assert stats['weight_stats']['median'] == weights.median()
+    assert stats['weight_stats']['std'] == pytest.approx(weights.std())
+    assert stats['weight_stats']['sum'] == weights.sum()
+    assert checks['negative_weights'] == 1
+
+
 def test_graph_summary_statistics_degree_stats():
     """Test degree statistics calculation."""
     edges = pd.DataFrame({
@@ -207,6 +242,104 @@ def test_validate_graph_with_issues():
     assert report['edge_checks']['duplicate_edges'] == 1
 
 
+def test_validate_graph_reports_all_failures_before_summary(monkeypatch):
+    """All violated checks are raised together and the summary is skipped."""
+    edges = pd.DataFrame({
+        "source": ["A", "A", "B"],
+        "target": ["A", "A", "C"]
+    })
+
+    def fail_summary(*args, **kwargs):
+        raise AssertionError("summary should not run")
+
+    monkeypatch.setattr(graph_validation, "_summary_statistics", fail_summary)
+    with pytest.raises(graph_validation.GraphValidationError) as exc:
+        graph_validation.validate_graph(
+            edges, all_nodes={"A", "B", "C", "D"},
+            allow_self_loops=False, verbose=False
+        )
+    message = str(exc.value)
+    assert "isolated" in message
+    assert "self-loop" in message
+    assert "duplicate" in message
+
+
+def test_validate_graph_without_summary():
+    edges = pd.DataFrame({"source": ["A", "B"], "target": ["B", "C"]})
+    report = graph_validation.validate_graph(edges, verbose=False, compute_summary=False)
+    assert report['validation_passed'] is True
+    assert report['summary'] == {'num_edges': 2}
+
+
+def test_check_edge_consistency_streaming_matches_full_frame():
+    edges = pd.DataFrame({
+        "source": ["A", "B", "A", "C", "A", "B"],
+        "target": ["B", "C", "B", "C", "D", "C"],
+        "weight": [1.0, -1.0, 2.0, 3.0, -4.0, 5.0],
+    })
+    batches = [edges.iloc[:2], edges.iloc[2:2], edges.iloc[2:5], edges.iloc[5:]]
+    with pytest.warns(graph_validation.GraphValidationWarning):
+        full = graph_validation.check_edge_consistency(edges, weight_col="weight", allow_duplicates=True)
+    with pytest.warns(graph_validation.GraphValidationWarning):
+        streamed = graph_validation.check_edge_consistency_streaming(
+            batches, weight_col="weight", allow_duplicates=True
+        )
+    assert streamed == full
+    assert streamed['duplicate_edges'] == 2
+
+    with pytest.raises(graph_validation.GraphValidationError, match="duplicate"):
+        graph_validation.check_edge_consistency_streaming(iter(batches))
+
+
+def test_graph_view_is_reused_across_checks():
+    edges = pd.DataFrame({"from": ["A", "B", "A"], "to": ["B", "C", "B"]})
+    view = graph_validation.GraphView(edges, source_col="from", target_col="to")
+
+    stats = graph_validation.graph_summary_statistics(view)
+    checks = graph_validation.check_edge_consistency(view, allow_duplicates=True)
+    connected, _ = graph_validation.check_isolated_nodes(view)
+
+    assert stats['num_nodes'] == 3
+    assert checks['duplicate_edges'] == 1
+    assert connected == {"A", "B", "C"}
+    assert list(view.out_deg + view.in_deg) == [2, 3, 1]
+
+
+def test_encode_graph_round_trips_and_validates():
+    edges = pd.DataFrame({
+        "source": ["A", "B", "A"],
+        "target": ["B", "C", "B"],
+        "weight": [1.0, 2.0, 3.0],
+    })
+    encoded, node_index = graph_validation.encode_graph(edges)
+
+    assert encoded["source"].dtype == np.int64
+    assert list(node_index[encoded["target"]]) == ["B", "C", "B"]
+    assert encoded["weight"].tolist() == [1.0, 2.0, 3.0]
+
+    checks = graph_validation.check_edge_consistency(encoded, allow_duplicates=True)
+    assert checks["duplicate_edges"] == 1
+
+    all_nodes = node_index.get_indexer(["A", "B", "C"])
+    all_nodes = np.append(all_nodes, len(node_index))  # a node with no edges
+    _, isolated = graph_validation.check_isolated_nodes(encoded, all_nodes=all_nodes, allow_isolated=True)
+    assert isolated == {3}
+
+
+def test_check_isolated_nodes_array_input():
+    edges = pd.DataFrame({"source": ["A", "B"], "target": ["B", "C"]})
+    all_nodes = np.array(["A", "D", "E", "D", "C"], dtype=object)
+    _, isolated = graph_validation.check_isolated_nodes(edges, all_nodes=all_nodes, allow_isolated=True)
+    assert isolated == {"D", "E"}
+
+
+def test_encode_graph_keeps_nulls():
+    edges = pd.DataFrame({"source": ["A", None], "target": ["B", "A"]})
+    encoded, _ = graph_validation.encode_graph(edges)
+    with pytest.raises(graph_validation.GraphValidationError):
+        graph_validation.check_edge_consistency(encoded)
+
+
 def test_custom_column_names():
     """Test with custom column names."""
     edges = pd.DataFrame({
@@ -254,3 +387,43 @@ def test_empty_graph():
     assert stats['num_edges'] == 0
     assert stats['num_nodes'] == 0
     assert stats['density'] == 0.0
+
+
+def test_empty_graph_checks_and_report():
+    """Test that every check handles an edge list with no rows."""
+    edges = pd.DataFrame({"source": [], "target": [], "weight": []})
+
+    checks = graph_validation.check_edge_consistency(edges, weight_col="weight")
+    assert checks == {'null_values': 0, 'self_loops': 0, 'duplicate_edges': 0, 'negative_weights': 0}
+
+    connected, isolated = graph_validation.check_isolated_nodes(edges, all_nodes={"A"}, allow_isolated=True)
+    assert connected == set()
+    assert isolated == {"A"}
+
+    report = graph_validation.validate_graph(edges, weight_col="weight", verbose=False)
+    assert report['validation_passed'] is True
+    assert report['summary']['weight_stats']['sum'] == 0.0
+
+    with pytest.raises(KeyError):
+        graph_validation.graph_summary_statistics(edges, weight_col="missing")
+
+
+def test_edge_scan_kernel_matches_numpy(monkeypatch):
+    """Test the numba edge scan counts like the NumPy path."""
+    pytest.importorskip("numba")
+    edges = pd.DataFrame({
+        "source": ["A", "B", "C", None, "A", "D"],
+        "target": ["A", "C", "C", "B", "B", "A"],
+        "weight": [1.0, -2.0, np.nan, -0.5, 3.0, 0.0],
+    })
+
+    def counts(weight_col=None):
+        return graph_validation._edge_consistency_counts(graph_validation.GraphView(edges), weight_col)
+
+    expected, expected_unweighted = counts("weight"), counts()
+    monkeypatch.setattr(graph_validation, "_NUMBA_MIN_SIZE", 0)
+    assert counts("weight") == expected
+    assert counts() == expected_unweighted
+    assert expected['null_values'] == 1
+    assert expected['self_loops'] == 2
+    assert expected['negative_weights'] == 2
@@ -82,3 +82,15 @@ class TestHashBatch:
         """Should handle empty batch."""
         hashes = hashing.hash_batch([])
         assert hashes == []
+
+
+class TestTransactionDigester:
+    """Tests for transaction_digester function."""
+
+    def test_matches_compute_transaction_digest(self):
+        """Should produce the same digest as compute_transaction_digest."""
+        tx = {"id": "1", "payload": "test", "timestamp": "2024-01-01"}
+        expected = hashing.compute_transaction_digest(tx)
+        assert hashing.transaction_digester()(tx) == expected
+        digest_of = hashing.transaction_digester({"id"})
+        assert digest_of(tx) == hashing.compute_transaction_digest(tx, {"id"})
@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import pytest
 
 from astroml.features import imbalance
 
@@ -39,3 +40,21 @@ def test_dataframe_helper():
     out = imbalance.net_flow_ratio_from_transactions(df)
     assert "net_flow_ratio" in out.columns
     assert np.allclose(out["net_flow_ratio"].values, np.array([1.0, -1.0]))
+
+
+@pytest.mark.parametrize("log_scale", [False, True])
+def test_numba_kernel_matches_numpy(monkeypatch, log_scale):
+    pytest.importorskip("numba")
+    sent = np.array([[1.0, 0.0, np.nan], [5.0, 0.0, 1000.0]])
+    recv = np.array([[0.0, 0.0, 1.0], [5.0, 2.0, np.nan]])
+    idx = pd.Index(["a", "b", "c"])
+    cases = [(sent, recv), (pd.Series(sent[1], index=idx), pd.Series(recv[1], index=idx))]
+
+    expected = [imbalance.net_flow_ratio(s, r, log_scale=log_scale) for s, r in cases]
+    monkeypatch.setattr(imbalance, "_NUMBA_MIN_SIZE", 0)
+    for (s, r), want in zip(cases, expected):
+        got = imbalance.net_flow_ratio(s, r, log_scale=log_scale)
+        assert type(got) is type(want)
+        np.testing.assert_allclose(np.asarray(got), np.asarray(want))
+        if isinstance(want, pd.Series):
+            assert got.index.equals(want.index)
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import json
+import random
+import threading
+
+import pytest
+
+from astroml.ingestion.service import IngestionService
+from astroml.ingestion.state import IntervalSet, StateStore
+
+
+def make_service(tmp_path) -> IngestionService:
+    return IngestionService(state_store=StateStore(path=str(tmp_path / 'state.json')))
+
+
+def test_ingest_skips_processed_ledgers(tmp_path):
+    svc = make_service(tmp_path)
+    first = svc.ingest(start_ledger=0, end_ledger=4)
+    assert first.processed == [0, 1, 2, 3, 4]
+
+    second = svc.ingest(start_ledger=3, end_ledger=6)
+    assert second.attempted == [3, 4, 5, 6]
+    assert second.skipped == [3, 4]
+    assert second.processed == [5, 6]
+
+
+def test_ingest_with_workers_processes_in_order(tmp_path):
+    svc = make_service(tmp_path)
+    svc.ingest(start_ledger=2, end_ledger=3)
+
+    fetch_threads = set()
+    seen = []
+
+    def fetch(ledger_id):
+        fetch_threads.add(threading.get_ident())
+        return {'ledger': ledger_id}
+
+    def process(ledger_id, payload):
+        assert payload == {'ledger': ledger_id}
+        seen.append(ledger_id)
+
+    res = svc.ingest(start_ledger=0, end_ledger=39, fetch_fn=fetch, process_fn=process,
+                     workers=4, batch_size=8)
+
+    expected = [i for i in range(40) if i not in (2, 3)]
+    assert seen == expected
+    assert res.processed == expected
+    assert res.skipped == [2, 3]
+    assert threading.get_ident() not in fetch_threads
+    assert svc.state.load().last_processed_ledger == 39
+
+
+def test_ingest_fetch_error_keeps_earlier_progress(tmp_path):
+    svc = make_service(tmp_path)
+
+    def fetch(ledger_id):
+        if ledger_id == 5:
+            raise RuntimeError('boom')
+        return ledger_id
+
+    with pytest.raises(RuntimeError):
+        svc.ingest(start_ledger=0, end_ledger=9, fetch_fn=fetch, workers=3, batch_size=4)
+
+    assert svc.state.load().processed_ledgers == {0, 1, 2, 3, 4}
+
+
+def test_ingest_rejects_invalid_workers(tmp_path):
+    svc = make_service(tmp_path)
+    with pytest.raises(ValueError):
+        svc.ingest(start_ledger=0, end_ledger=1, workers=0)
+
+
+def test_state_store_logs_marks_and_compacts(tmp_path):
+    path = str(tmp_path / 'state.json')
+    store = StateStore(path=path)
+    for ledger_id in range(10):
+        store.mark_processed(ledger_id)
+
+    # Marks go to the append-only log, not the JSON snapshot
+    assert not (tmp_path / 'state.json').exists()
+    reopened = StateStore(path=path).load()
+    assert reopened.processed_ledgers == set(range(10))
+    assert reopened.last_processed_ledger == 9
+
+    # A torn trailing record is ignored
+    with open(store.wal_path, 'ab') as f:
+        f.write(b'\x01\x02')
+    assert StateStore(path=path).load().processed_ledgers == set(range(10))
+
+    store.mark_processed_many(range(10, 2000))
+    assert (tmp_path / 'state.json').exists()
+    state = StateStore(path=path).load()
+    assert state.processed_ledgers == set(range(2000))
+    assert state.last_processed_ledger == 1999
+
+
+def test_mark_processed_returns_copy(tmp_path):
+    store = StateStore(path=str(tmp_path / 'state.json'))
+    returned = store.mark_processed_many([1, 2])
+    returned.processed_ledgers.add(3)
+    returned.last_processed_ledger = 3
+
+    assert 3 not in store.mark_processed(2).processed_ledgers
+    assert store.mark_processed_many([]).last_processed_ledger == 2
+
+
+def test_state_store_compaction_keeps_other_writers(tmp_path, monkeypatch):
+    monkeypatch.setattr('astroml.ingestion.state._COMPACT_MIN_RECORDS', 2)
+    path = str(tmp_path / 'state.json')
+    a = StateStore(path=path)
+    b = StateStore(path=path)
+    a.mark_processed(1)
+    b.mark_processed(2)
+    a.mark_processed(3)
+    a.mark_processed(4)
+
+    assert (tmp_path / 'state.json').exists()
+    assert StateStore(path=path).load().processed_ledgers == {1, 2, 3, 4}
+
+
+def test_state_store_reads_existing_json_snapshot(tmp_path):
+    path = tmp_path / 'state.json'
+    path.write_text('{"last_processed_ledger": 7, "processed_ledgers": [5, 6, 7]}')
+    store = StateStore(path=str(path))
+    store.mark_processed(3)
+
+    state = StateStore(path=str(path)).load()
+    assert state.processed_ledgers == {3, 5, 6, 7}
+    assert state.last_processed_ledger == 7
+
+
+def test_interval_set_matches_set_semantics():
+    rng = random.Random(0)
+    values = [rng.randrange(200) for _ in range(300)]
+    intervals = IntervalSet()
+    expected = set()
+    for value in values:
+        intervals.add(value)
+        expected.add(value)
+        assert intervals == expected
+    intervals.update(range(150, 260))
+    expected.update(range(150, 260))
+
+    assert intervals == expected
+    assert len(intervals) == len(expected)
+    assert list(intervals) == sorted(expected)
+    assert all((v in intervals) == (v in expected) for v in range(-5, 270))
+    assert IntervalSet.from_intervals(intervals.intervals) == intervals
+
+
+def test_interval_set_set_api():
+    runs = IntervalSet([1, 2, 3, 7, 8])
+    assert None not in runs and 'x' not in runs and 2.5 not in runs
+    assert 2.0 in runs and True in runs
+
+    runs.discard(2)
+    runs.discard(99)
+    assert runs == {1, 3, 7, 8} and runs.intervals == [(1, 1), (3, 3), (7, 8)]
+    runs.remove(7)
+    with pytest.raises(KeyError):
+        runs.remove(7)
+    runs |= {4, 5}
+    assert runs == {1, 3, 4, 5, 8}
+    assert (runs | {9}) == {1, 3, 4, 5, 8, 9}
+    assert (runs - {1, 8}) == {3, 4, 5}
+    assert runs.issubset(range(10)) and runs.issuperset([3, 4])
+
+
+def test_state_snapshot_stores_ranges(tmp_path):
+    store = StateStore(path=str(tmp_path / 'state.json'))
+    state = store.load()
+    state.processed_ledgers.update([1, 2, 3, 7, 8])
+    state.last_processed_ledger = 8
+    store.save(state)
+
+    data = json.loads((tmp_path / 'state.json').read_text())
+    assert data['processed_ranges'] == [[1, 3], [7, 8]]
+    assert StateStore(path=str(tmp_path / 'state.json')).load().processed_ledgers == {1, 2, 3, 7, 8}
+
+
+def test_interval_set_split_range():
+    runs = IntervalSet([1, 2, 3, 7, 8, 12])
+    for start, end in [(0, 15), (2, 7), (4, 6), (8, 8), (13, 20), (-3, 0)]:
+        members, others = runs.split_range(start, end)
+        ids = range(start, end + 1)
+        assert members == [i for i in ids if i in runs]
+        assert others == [i for i in ids if i not in runs]
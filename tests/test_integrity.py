@@ -57,6 +57,52 @@ class TestIntegrityValidator:
         assert len(result.valid) == 2
         assert len(result.duplicates) == 1
 
+    def test_process_indices(self):
+        """Should return positions of valid, duplicate and corrupted rows."""
+        v = integrity.IntegrityValidator(required_fields={"id", "timestamp"})
+        txs = [
+            {"id": "1", "timestamp": "2024-01-01"},
+            {"id": "2"},  # missing timestamp
+            {"id": "1", "timestamp": "2024-01-01"},  # duplicate
+            {"id": "3", "timestamp": "2024-01-03"},
+        ]
+        result = v.process_indices(txs)
+        assert result.valid.tolist() == [0, 3]
+        assert result.duplicates.tolist() == [2]
+        assert result.corrupted.tolist() == [1]
+        assert result.is_valid is False
+        assert len(result.conflicts) == 1
+
+    def test_process_workers(self):
+        """Should classify a batch the same way with worker processes."""
+        txs = [
+            {"id": "1", "timestamp": "2024-01-01"},
+            {"id": "2"},  # missing timestamp
+            {"id": "1", "timestamp": "2024-01-01"},  # duplicate
+            {"id": "3", "timestamp": "2024-01-03"},
+            {"id": "3", "timestamp": "2024-01-03"},  # duplicate
+        ]
+        serial = integrity.IntegrityValidator(required_fields={"id", "timestamp"}).process(txs)
+        v = integrity.IntegrityValidator(required_fields={"id", "timestamp"}, workers=2)
+        result = v.process(txs)
+        assert result.valid == serial.valid
+        assert result.duplicates == serial.duplicates
+        assert result.corrupted == serial.corrupted
+        assert result.all_hashes == serial.all_hashes
+        assert len(v.conflicts) == 2
+
+        with pytest.raises(ValueError, match="workers"):
+            integrity.IntegrityValidator(workers=0)
+
+    def test_process_malformed(self):
+        """Should classify non-dict transactions as corrupted."""
+        txs = [{"id": "1"}, None, "not a dict"]
+        for workers in (1, 2):
+            result = integrity.IntegrityValidator(required_fields={"id"}, workers=workers).process(txs)
+            assert result.valid == [{"id": "1"}]
+            assert result.corrupted == [None, "not a dict"]
+            assert len(result.all_hashes) == 1
+
     def test_strict_mode(self):
         """Should raise error in strict mode on corruption."""
         v = integrity.IntegrityValidator(required_fields={"id"}, strict=True)
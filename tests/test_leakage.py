@@ -34,6 +34,17 @@ def test_temporal_split_cutoff():
     assert len(train) + len(test) == len(df)
 
 
+def test_temporal_split_cutoff_matches_mask():
+    df = _make_df(10)
+    df.index = list("abcdefghij")
+    cutoff = pd.Timestamp("2024-01-04 12:00")
+    for frame in (df, df.iloc[::-1]):
+        train, test = leakage.temporal_train_test_split(frame, "timestamp", cutoff=cutoff)
+        mask = frame["timestamp"] < cutoff
+        pd.testing.assert_frame_equal(train, frame.loc[mask])
+        pd.testing.assert_frame_equal(test, frame.loc[~mask])
+
+
 def test_temporal_split_ratio():
     df = _make_df(10)
     train, test = leakage.temporal_train_test_split(df, "timestamp", train_ratio=0.8)
@@ -44,6 +55,16 @@ def test_temporal_split_ratio():
     assert train["timestamp"].max() < test["timestamp"].min()
 
 
+def test_temporal_split_ratio_matches_sorted_frame():
+    df = _make_df(10)
+    df.index = list("abcdefghij")
+    expected = df.sort_values("timestamp").reset_index(drop=True)
+    for frame in (df, df.iloc[::-1]):
+        train, test = leakage.temporal_train_test_split(frame, "timestamp", train_ratio=0.7)
+        pd.testing.assert_frame_equal(train, expected.iloc[:7])
+        pd.testing.assert_frame_equal(test, expected.iloc[7:])
+
+
 def test_temporal_split_missing_col():
     df = _make_df(5)
     with pytest.raises(ValueError, match="not found"):
@@ -120,6 +141,34 @@ def test_check_feature_leakage_constant_col():
     assert any(w.warning_type == "constant" and w.column == "const" for w in results)
 
 
+def test_check_feature_leakage_constant_nulls():
+    df = _make_df(5)
+    df["all_null"] = np.nan
+    df["null_and_value"] = [np.nan, 1.0, 1.0, 1.0, 1.0]
+    df["const_int"] = 7
+    results = leakage.check_feature_leakage(
+        df, "timestamp", feature_cols=["all_null", "null_and_value", "const_int", "amount"]
+    )
+    assert [w.column for w in results] == ["all_null", "const_int"]
+
+
+def test_constant_columns_kernel_matches_numpy(monkeypatch):
+    pytest.importorskip("numba")
+    df = _make_df(5)
+    nan = np.nan
+    df["all_null"] = nan
+    df["const"] = 2.0
+    df["nan_inside"] = [1.0, nan, 1.0, 1.0, 1.0]
+    df["value_inside"] = [1.0, 1.0, 1.0, 5.0, 1.0]
+    df["nan_ends"] = [nan, 1.0, nan, 1.0, nan]
+    cols = ["all_null", "const", "nan_inside", "value_inside", "nan_ends"]
+
+    expected = leakage.check_feature_leakage(df, "timestamp", feature_cols=cols)
+    monkeypatch.setattr(leakage, "_NUMBA_MIN_SIZE", 0)
+    assert leakage.check_feature_leakage(df, "timestamp", feature_cols=cols) == expected
+    assert [w.column for w in expected] == ["all_null", "const"]
+
+
 def test_check_feature_leakage_clean():
     df = _make_df(10)
     results = leakage.check_feature_leakage(df, "timestamp")
@@ -147,3 +196,36 @@ def test_check_target_leakage_clean():
     })
     results = leakage.check_target_leakage(df, "target")
     assert results == []
+
+
+def test_check_target_leakage_matches_pandas_with_nulls():
+    df = _make_df(20)
+    df["target"] = df["amount"]
+    df["leaky"] = -3.0 * df["amount"]
+    df["constant"] = 1.0
+    df.loc[4, "leaky"] = np.nan
+    df.loc[9, "target"] = np.nan
+    results = leakage.check_target_leakage(
+        df, "target", feature_cols=["leaky", "constant", "score"], threshold=0.0
+    )
+    expected = [
+        c for c in ["leaky", "score"]
+        if abs(df["target"].corr(df[c])) > 0.0
+    ]
+    assert [w.column for w in results] == expected
+    assert "(-1.0000)" in results[0].message
+
+
+def test_leakage_scanner_runs_both_checks():
+    df = _make_df(20)
+    df["target"] = df["amount"]
+    df["const"] = 3.0
+    scanner = leakage.LeakageScanner(df)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        feature = scanner.check_feature_leakage("timestamp")
+        target = scanner.check_target_leakage("target")
+    assert [w.column for w in feature] == ["const"]
+    assert [w.column for w in target] == ["amount"]
+    assert feature == leakage.check_feature_leakage(df, "timestamp")
+    assert all(w.filename == __file__ for w in caught)
@@ -61,6 +61,13 @@ def test_parse_memo_missing_keys():
     assert result == {'type': 'none', 'value': None, 'is_malformed': True}
 
 
+def test_parse_memo_cache_keeps_value_types_apart():
+    assert memo.parse_memo({'type': 'text', 'value': 'x'})['value'] == 'x'
+    assert memo.parse_memo({'type': 'text', 'value': True})['is_malformed'] is True
+    # Unhashable values skip the cache but parse the same way
+    assert memo.parse_memo({'type': 'id', 'value': [1]}) == {'type': 'id', 'value': None, 'is_malformed': True}
+
+
 def test_extract_memo_features():
     df = pd.DataFrame({
         'memo': [
@@ -78,6 +85,7 @@ def test_extract_memo_features():
     assert 'memo_is_malformed' in result.columns
 
     assert result['memo_type'].tolist() == ['text', 'id', 'hash', 'none', 'none']
+    assert list(result['memo_type'].cat.categories) == list(memo.MEMO_TYPES)
     assert result['memo_value'].tolist() == ['hello', 42, 'a' * 64, None, None]
     assert result['memo_length'].tolist() == [5, 0, 0, 0, 0]
     assert result['memo_is_malformed'].tolist() == [False, False, False, True, True]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import random
-from astroml.features.graph.snapshot import Edge, window_snapshot, snapshot_last_n_days
+from astroml.features.graph.snapshot import Edge, SnapshotStore, window_snapshot, snapshot_last_n_days
 
 
 def make_edges(n: int, start_ts: int = 1, step: int = 60):
@@ -77,3 +77,33 @@ def test_invalid_params():
         assert False, "expected ValueError for non-positive days"
     except ValueError:
         pass
+
+
+def test_snapshot_store_matches_window_snapshot():
+    edges = make_edges(50, start_ts=100, step=7)
+    shuffled = list(edges)
+    random.shuffle(shuffled)
+    store = SnapshotStore(shuffled, presorted=False)
+    assert len(store) == 50
+
+    for start, end in [(100, 100), (150, 260), (0, 10), (300, 10_000)]:
+        assert window_snapshot(store, start, end) == window_snapshot(edges, start, end)
+
+    nodes, win = snapshot_last_n_days(store, now_ts=edges[-1].timestamp, days=1)
+    assert win == edges
+    assert nodes == {e.src for e in edges} | {e.dst for e in edges}
+
+
+def test_snapshot_store_window_ids():
+    edges = make_edges(20)
+    store = SnapshotStore(edges)
+
+    codes, span = store.window_ids(120, 300)
+    nodes, win = store.window(120, 300)
+    assert store.edges[span] == win
+    assert {store.id_to_str[c] for c in codes.tolist()} == nodes
+    assert list(codes) == sorted(codes)
+
+    codes, span = store.window_ids(10_000, 20_000)
+    assert codes.size == 0
+    assert store.edges[span] == []
@@ -23,6 +23,7 @@ def test_multi_asset_support():
     assert set(graph.get_assets()) == {"USD", "BTC"}
     assert graph.get_edge_weight("Alice", "Bob", asset="USD") == 100.0
     assert graph.get_edge_weight("Alice", "Bob", asset="BTC") == 0.5
+    assert graph.get_edge_weight("Alice", "Bob", asset="ETH") == 0.0
 
 
 def test_weighted_edges():
@@ -68,6 +69,15 @@ def test_get_transactions_filtering():
     assert bob_to_charlie[0]["asset"] == "BTC"
 
 
+def test_get_transactions_interleaved_with_inserts():
+    """Test queries see transactions added after earlier queries."""
+    graph = TransactionGraph()
+    for i in range(20):
+        graph.add_transaction("Alice", "Bob", float(i), asset="USD" if i % 2 else "BTC")
+        usd = graph.get_transactions(asset="USD")
+        assert [t["amount"] for t in usd] == [float(j) for j in range(1, i + 1, 2)]
+
+
 def test_networkx_export():
     """Test export to NetworkX format."""
     pytest.importorskip("networkx")
@@ -99,6 +109,25 @@ def test_networkx_export_with_metadata():
     assert "transactions" in nx_graph["Alice"]["Bob"]
 
 
+def test_networkx_export_cache():
+    """Test cached exports are independent copies refreshed on insert."""
+    pytest.importorskip("networkx")
+
+    graph = TransactionGraph()
+    graph.add_transaction("Alice", "Bob", 100.0)
+
+    first = graph.to_networkx()
+    first["Alice"]["Bob"]["weight"] = 0.0
+    first.add_edge("Bob", "Alice")
+    second = graph.to_networkx()
+    assert second is not first
+    assert second["Alice"]["Bob"]["weight"] == 100.0
+    assert not second.has_edge("Bob", "Alice")
+
+    graph.add_transaction("Alice", "Bob", 50.0)
+    assert graph.to_networkx()["Alice"]["Bob"]["weight"] == 150.0
+
+
 def test_graph_summary():
     """Test graph summary statistics."""
     graph = TransactionGraph()
@@ -124,3 +153,50 @@ def test_empty_graph():
     assert graph.get_edge_weight("Alice", "Bob") == 0.0
     assert graph.get_assets() == []
     assert graph.get_transactions() == []
+
+
+def test_edge_weight_updates_on_insert():
+    """Edge weights reflect transactions added after an earlier query."""
+    graph = TransactionGraph()
+    graph.add_transaction("Alice", "Bob", 100.0, asset="USD")
+    graph.add_transaction("Bob", "Carol", 10.0, asset="USD")
+
+    assert graph.get_edge_weight("Alice", "Bob") == 100.0
+    assert graph.get_edge_weight("Alice", "Bob", asset="USD", aggregation="max") == 100.0
+
+    graph.add_transaction("Alice", "Bob", 300.0, asset="USD")
+    graph.add_transaction("Alice", "Bob", 5.0, asset="BTC")
+
+    assert graph.get_edge_weight("Alice", "Bob") == 405.0
+    assert graph.get_edge_weight("Alice", "Bob", asset="USD", aggregation="max") == 300.0
+    assert graph.get_edge_weight("Bob", "Carol") == 10.0
+    assert graph.get_edge_weight("Alice", "Bob", aggregation="min") == 5.0
+    assert graph.get_edge_weight("Alice", "Bob", aggregation="mean") == 135.0
+    assert graph.get_edge_weight("Alice", "Bob", asset="USD", aggregation="count") == 2.0
+
+
+def test_integer_amounts_and_edge_views():
+    """Integer amounts aggregate to ints and views keep their read behaviour."""
+    graph = TransactionGraph()
+    graph.add_transaction("Alice", "Bob", 2)
+    graph.add_transaction("Alice", "Bob", 3)
+
+    weight = graph.get_edge_weight("Alice", "Bob")
+    assert weight == 5 and isinstance(weight, int)
+    assert isinstance(graph.get_edge_weight("Alice", "Bob", aggregation="max"), int)
+    assert graph.edges["Carol"]["Dave"] == []
+    assert "Alice" in graph.nodes and len(graph.nodes) == 2
+
+
+def test_edges_view_is_cached_until_insert():
+    """Test the nested edges view is reused until a transaction is added."""
+    graph = TransactionGraph()
+    graph.add_transaction("Alice", "Bob", 100.0)
+
+    view = graph.edges
+    assert graph.edges is view
+    assert len(view["Alice"]["Bob"]) == 1
+
+    graph.add_transaction("Alice", "Bob", 50.0)
+    assert graph.edges is not view
+    assert [t["amount"] for t in graph.edges["Alice"]["Bob"]] == [100.0, 50.0]
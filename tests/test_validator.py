@@ -38,6 +38,35 @@ class TestTransactionValidator:
         assert result.is_valid is False
         assert any(e.error_type == validator.CorruptionType.INVALID_TYPE for e in result.errors)
 
+    def test_schema_reassignment(self):
+        """Should apply required fields and types assigned after construction."""
+        v = validator.TransactionValidator(required_fields={"id"})
+        v.required_fields = {"id", "timestamp"}
+        v.field_types = {"id": str}
+        result = v.validate({"id": 1})
+        assert {e.error_type for e in result.errors} == {
+            validator.CorruptionType.MISSING_FIELD,
+            validator.CorruptionType.INVALID_TYPE,
+        }
+
+    def test_schema_in_place_mutation_fails(self):
+        """Should refuse in-place schema edits instead of silently ignoring them."""
+        v = validator.TransactionValidator(required_fields={"id"}, field_types={"id": str})
+        with pytest.raises(AttributeError):
+            v.required_fields.add("amount")
+        with pytest.raises(TypeError):
+            v.field_types["id"] = int
+        assert v.validate({"id": "a"}).is_valid is True
+
+    def test_errors_share_timestamp(self):
+        """Should stamp every error of one transaction with the same time."""
+        v = validator.TransactionValidator(
+            required_fields={"id", "timestamp"}, field_types={"payload": str}
+        )
+        result = v.validate({"payload": 1}, stored_hash="wrong_hash")
+        assert len(result.errors) == 4
+        assert len({e.timestamp for e in result.errors}) == 1
+
     def test_malformed_structure(self):
         """Should reject non-dict transaction."""
         v = validator.TransactionValidator()
@@ -67,6 +96,35 @@ class TestTransactionValidator:
         assert results[1].is_valid is True
         assert results[2].is_valid is False
 
+    def test_batch_validation_malformed(self):
+        """Should report non-dict rows as malformed instead of raising."""
+        v = validator.TransactionValidator(required_fields={"id"})
+        results = v.validate_batch([{"id": "1"}, None, {"id": "2"}])
+        assert [r.is_valid for r in results] == [True, False, True]
+        assert results[1].hash is None
+        assert results[1].errors[0].error_type == validator.CorruptionType.MALFORMED_STRUCTURE
+        assert results[2].hash == v.validate({"id": "2"}).hash
+
+    def test_batch_validation_workers(self):
+        """Should return the same results, in order, when run in processes."""
+        v = validator.TransactionValidator(required_fields={"id"}, field_types={"id": str})
+        txs = [{"id": str(i)} if i % 3 else {"id": i} for i in range(10)]
+        stored = [None] * 5 + ["wrong_hash"]
+        expected = v.validate_batch(txs, stored)
+        results = v.validate_batch(txs, stored, workers=3)
+        assert [(r.is_valid, r.hash) for r in results] == [
+            (r.is_valid, r.hash) for r in expected
+        ]
+        assert [[e.message for e in r.errors] for r in results] == [
+            [e.message for e in r.errors] for r in expected
+        ]
+
+    def test_batch_validation_invalid_workers(self):
+        """Should reject a worker count below one."""
+        v = validator.TransactionValidator()
+        with pytest.raises(ValueError, match="workers"):
+            v.validate_batch([{"id": "1"}], workers=0)
+
 
 class TestValidateTransaction:
     """Tests for validate_transaction convenience function."""